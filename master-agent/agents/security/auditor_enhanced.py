@@ -17,16 +17,162 @@ Capabilities:
 - Compliance reporting
 """
 
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Any, Optional, Sequence, Tuple, Union
+from collections import Counter
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 from datetime import datetime
+import asyncio
+import hashlib
 import json
 import re
 import logging
 
+from .scan_utils import (
+    WRITE_BUFFER_SIZE, Buffer, LineIndex, LiteralPrescreen, MultiPatternMatcher, compile_pattern, filter_scannable,
+    glob_matcher, is_dotenv, is_readable_file, iter_chunks, loads_json, open_for_scan, read_files_async, readable_size,
+    walk_files, write_json
+)
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.specifiers import SpecifierSet
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Requirement = None
+
 logger = logging.getLogger(__name__)
 
+# Size limits above which files are not pattern-scanned
+_MAX_CODE_FILE_BYTES = 2_000_000
+_MAX_SECRET_FILE_BYTES = 5_000_000
+
+# Severity levels counted in report summaries, most severe first
+_SEVERITY_LEVELS = ("critical", "high", "medium", "low", "info")
+
+# Markdown report markers per severity
+_SEVERITY_EMOJI = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🔵",
+    "info": "⚪"
+}
+
+# Output formats save_report can write
+_REPORT_FORMATS = ("json", "md")
+
+# Markdown issue block pieces, filled once per issue; the optional file location
+# follows the head and the optional CWE/CVE lines follow the body
+_ISSUE_HEAD_TMPL = "### {emoji} {title}\n\n**Severity**: {severity}\n**Category**: {category}\n"
+_ISSUE_BODY_TMPL = "\n**Description**: {description}\n\n**Remediation**: {remediation}\n\n"
+
+# Filename globs selecting the files each per-file scanner reads
+_OWASP_GLOBS = ("*.py", "*.js", "*.ts", "*.tsx")
+_PROMPT_INJECTION_GLOBS = ("*.py", "*.js", "*.ts")
+_SECRET_GLOBS = ("*.py", "*.js", "*.ts", "*.env*", "*.json", "*.yaml", "*.yml")
+
+# Bump whenever the known-vulnerability tables change to invalidate cached results
+_DEP_CACHE_VERSION = 3
+
+# Known vulnerable packages (example - would query CVE database)
+_PY_KNOWN_VULNS = {
+    "django": {"versions": "<3.2.0", "cve": "CVE-2021-35042", "severity": "high", "fixed": "3.2.0"},
+    "flask": {"versions": "<2.0.0", "cve": "CVE-2023-30861", "severity": "medium", "fixed": "2.3.0"},
+    "requests": {"versions": "<2.31.0", "cve": "CVE-2023-32681", "severity": "medium", "fixed": "2.31.0"},
+}
+_NPM_KNOWN_VULNS = {
+    "axios": {"versions": "<1.6.0", "cve": "CVE-2023-45857", "severity": "medium", "fixed": "1.6.0"},
+    "express": {"versions": "<4.18.0", "cve": "CVE-2022-24999", "severity": "high", "fixed": "4.18.0"},
+}
+
+# A requirement line (or quoted pyproject entry) naming a known package, through
+# end of line; the lookahead stops "requests" from matching "requests-oauthlib"
+_PY_VULN_RE = compile_pattern(
+    rb'^\s*["\']?(' + b'|'.join(re.escape(name.encode()) for name in _PY_KNOWN_VULNS) + rb')(?![\w.-])[^\r\n]*',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Manifests naming none of the known packages, in any case, skip the regex
+_PY_VULN_PRESCREEN = LiteralPrescreen({name: (name.encode(),) for name in _PY_KNOWN_VULNS}, ignore_case=True)
+
+# Hardcoded secret patterns: (regex, flags, secret type, case-insensitive triggers)
+_SECRET_PATTERNS = (
+    (rb'(?i)(api[_-]?key|apikey)["\']?\s*[:=]\s*["\']([a-zA-Z0-9_\-]{20,})["\']', 0, "API Key", (b"api",)),
+    (rb'(?i)(password|passwd|pwd)["\']?\s*[:=]\s*["\']([^"\']{8,})["\']', 0, "Password", (b"passw", b"pwd")),
+    (rb'(?i)(secret|token)["\']?\s*[:=]\s*["\']([a-zA-Z0-9_\-]{20,})["\']', 0, "Secret/Token", (b"secret", b"token")),
+    (rb'-----BEGIN (RSA |EC )?PRIVATE KEY-----', 0, "Private Key", (b"-----begin ",)),
+    (rb'(?i)aws[_-]?access[_-]?key[_-]?id["\']?\s*[:=]\s*["\']([A-Z0-9]{20})["\']', 0, "AWS Access Key", (b"aws",)),
+    (rb'(?i)sk_live_[a-zA-Z0-9]{24,}', 0, "Stripe Live Key", (b"sk_live_",)),
+)
+
+_SECRET_PRESCREEN = LiteralPrescreen(
+    {index: triggers for index, (_, _, _, triggers) in enumerate(_SECRET_PATTERNS)}, ignore_case=True
+)
+
+# SOC2 CC6.1 / CC6.6 positive signals (any single match satisfies the check)
+_RBAC_RE = compile_pattern(rb'role|permission|authorize|can_access', re.IGNORECASE)
+_HTTPS_CONFIG_RE = compile_pattern(rb'https|ssl', re.IGNORECASE)
+
+# Carried between chunks so a signal keyword split across a boundary still matches
+_SIGNAL_OVERLAP = 64
+
+# SOC2 CC6.7: plain-HTTP URLs to non-local hosts
+_HTTP_URL_RE = compile_pattern(rb'http://(?!localhost|127\.0\.0\.1)')
+
+# OWASP Top 10 detectors, fused into a single regex pass per file:
+# (name, regex, literal triggers at least one of which every match contains)
+_OWASP_DETECTORS = (
+    ("endpoint", rb'@app\.(?:get|post|put|delete)', (b"@app.",)),
+    ("auth_decorator", rb'@(?:require_auth|login_required|authorize)',
+     (b"@require_auth", b"@login_required", b"@authorize")),
+    ("weak_hash", rb'hashlib\.(?:md5|sha1)', (b"hashlib.",)),
+    ("sql_injection", rb'execute\(.*\+|cursor\.execute\(f["\']', (b"execute(",)),
+    ("os_command", rb'os\.(?:system|popen|exec)', (b"os.",)),
+    ("debug_mode", rb'DEBUG\s*=\s*True|debug:\s*true', (b"DEBUG", b"debug:")),
+    ("xss", rb'innerHTML\s*=|dangerouslySetInnerHTML', (b"innerHTML",)),
+    ("deserialization", rb'pickle\.loads|yaml\.load\(', (b"pickle.loads", b"yaml.load(")),
+)
+
+_OWASP_PRESCREEN = LiteralPrescreen({name: triggers for name, _, triggers in _OWASP_DETECTORS})
+
+# LLM API usage markers (matched case-insensitively)
+_LLM_API_PRESCREEN = LiteralPrescreen(
+    {"llm_api": (b"openai.", b"anthropic.", b"ChatCompletion", b"messages.create", b"llm(", b"chat(")},
+    ignore_case=True
+)
+_INPUT_SANITIZATION_RES = tuple(
+    compile_pattern(pattern, re.IGNORECASE)
+    for pattern in (rb'sanitize', rb'validate_input', rb'clean_input', rb'escape', rb'strip_tags')
+)
+_OUTPUT_VALIDATION_RES = tuple(
+    compile_pattern(pattern, re.IGNORECASE)
+    for pattern in (rb'validate_output', rb'sanitize_output', rb'check_response')
+)
+
+
+@lru_cache(maxsize=None)
+def _owasp_regex(names: FrozenSet[str]):
+    """
+    Fuse the named OWASP detectors into one regex
+
+    Zero-width alternation: every offset is tried against every detector, so
+    a long match for one detector never hides an overlapping match for another.
+    """
+    return compile_pattern(
+        b"(?=" + b"|".join(
+            b"(?P<%s>%s)" % (name.encode(), regex) for name, regex, _ in _OWASP_DETECTORS if name in names
+        ) + b")"
+    )
+
+
+@lru_cache(maxsize=None)
+def _secret_matcher(indices: Tuple[int, ...]) -> MultiPatternMatcher:
+    """Single-pass matcher over a subset of _SECRET_PATTERNS (Hyperscan when installed)"""
+    return MultiPatternMatcher([_SECRET_PATTERNS[index][:2] for index in indices])
+
 
 @dataclass
 class SOC2Control:
@@ -74,6 +220,184 @@ class DependencyVulnerability:
     cvss_score: float
 
 
+@dataclass(frozen=True)
+class _FileScan:
+    """A per-file scanner in a scan plan: which files it reads and how it checks them"""
+
+    name: str
+    patterns: Tuple[str, ...]
+    max_bytes: Optional[int]
+    check: Optional[Callable[[Buffer, Path], List[SecurityIssue]]] = None
+    exclude: Optional[Callable[[str], bool]] = None
+
+
+def _issue_json(obj: Any) -> Dict[str, Any]:
+    """JSON report entry for a SecurityIssue, built only when the report is serialized"""
+    if isinstance(obj, SecurityIssue):
+        return {
+            "severity": obj.severity,
+            "category": obj.category,
+            "title": obj.title,
+            "description": obj.description,
+            "file": obj.file_path,
+            "line": obj.line_number,
+            "remediation": obj.remediation,
+            "cwe_id": obj.cwe_id,
+            "cve_id": obj.cve_id
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _parse_requirement(line: bytes) -> Optional["Requirement"]:
+    """Parse a requirements.txt line or quoted pyproject entry, None if unparseable"""
+    text = line.split(b" #", 1)[0].strip().strip(b"\"',").strip()
+    try:
+        return Requirement(text.decode(errors="replace"))
+    except InvalidRequirement:
+        return None
+
+
+def _pins_outside(requirement: "Requirement", vulnerable_versions: str) -> bool:
+    """True when the requirement pins exact versions, none of them in the vulnerable range"""
+    pins = [
+        spec.version for spec in requirement.specifier
+        if spec.operator in ("==", "===") and "*" not in spec.version
+    ]
+    if not pins:
+        return False
+
+    vulnerable = SpecifierSet(vulnerable_versions)
+    try:
+        return not any(vulnerable.contains(Version(pin), prereleases=True) for pin in pins)
+    except InvalidVersion:
+        return False
+
+
+def _as_buffer(content: Union[str, Buffer]) -> Buffer:
+    """File bytes for the pattern checks, encoding text passed in by direct callers"""
+    return content.encode() if isinstance(content, str) else content
+
+
+# SOC2 Type II control definitions, built once per process. Each auditor
+# works on fresh copies so per-run findings never leak between instances.
+_SOC2_CONTROLS: Dict[str, SOC2Control] = {
+    "CC6.1": SOC2Control(
+        control_id="CC6.1",
+        name="Logical and Physical Access Controls",
+        category="access_control",
+        description="Implements controls to prevent unauthorized access",
+        requirements=[
+            "Authentication mechanisms",
+            "Authorization controls",
+            "Role-based access control (RBAC)",
+            "Multi-factor authentication (MFA)",
+            "Session management"
+        ],
+        validation_steps=[
+            "Check for authentication middleware",
+            "Verify RBAC implementation",
+            "Validate MFA support",
+            "Review session timeout configuration"
+        ]
+    ),
+    "CC6.6": SOC2Control(
+        control_id="CC6.6",
+        name="Encryption of Data",
+        category="encryption",
+        description="Encrypts data in transit and at rest",
+        requirements=[
+            "TLS/SSL for data in transit",
+            "Encryption at rest for sensitive data",
+            "Strong encryption algorithms (AES-256)",
+            "Secure key management"
+        ],
+        validation_steps=[
+            "Check HTTPS enforcement",
+            "Verify database encryption",
+            "Validate encryption algorithm strength",
+            "Review key storage mechanisms"
+        ]
+    ),
+    "CC6.7": SOC2Control(
+        control_id="CC6.7",
+        name="Transmission of Data",
+        category="encryption",
+        description="Protects data during transmission",
+        requirements=[
+            "HTTPS/TLS for all external communication",
+            "Certificate validation",
+            "Secure protocols (TLS 1.2+)",
+            "HSTS headers"
+        ],
+        validation_steps=[
+            "Check for HTTPS-only communication",
+            "Verify TLS version >= 1.2",
+            "Validate HSTS implementation",
+            "Check for mixed content"
+        ]
+    ),
+    "CC7.2": SOC2Control(
+        control_id="CC7.2",
+        name="Detection and Monitoring",
+        category="monitoring",
+        description="Detects and responds to security events",
+        requirements=[
+            "Logging of security events",
+            "Monitoring and alerting",
+            "Incident response procedures",
+            "Anomaly detection"
+        ],
+        validation_steps=[
+            "Check logging implementation",
+            "Verify monitoring tools",
+            "Review alert configurations",
+            "Validate incident response plan"
+        ]
+    )
+}
+
+# OWASP Top 10 detection patterns
+_OWASP_PATTERNS: Dict[str, List[Dict[str, Any]]] = {
+    "sql_injection": [
+        {"regex": r"execute\(.*\+.*\)", "desc": "String concatenation in SQL query"},
+        {"regex": r"query\(.*f['\"].*{.*}.*['\"]", "desc": "F-string in SQL query"},
+    ],
+    "xss": [
+        {"regex": r"innerHTML\s*=\s*.*", "desc": "Direct innerHTML assignment"},
+        {"regex": r"dangerouslySetInnerHTML", "desc": "Dangerous HTML insertion"},
+    ],
+    "broken_auth": [
+        {"regex": r"password.*==.*['\"]", "desc": "Hardcoded password comparison"},
+        {"regex": r"jwt.*verify.*verify:\s*false", "desc": "JWT verification disabled"},
+    ]
+}
+
+# Prompt injection detection patterns, compiled once at import
+_PROMPT_INJECTION_PATTERNS: List[Dict[str, Any]] = [
+    {**pattern, "compiled": compile_pattern(pattern["regex"].encode(), re.IGNORECASE)}
+    for pattern in (
+        {
+            "name": "Direct user input in prompt",
+            "regex": r"(prompt|messages)\s*=\s*.*\+\s*(user_input|request\.|input\()",
+            "description": "User input directly concatenated into LLM prompt",
+            "remediation": "Use parameterized prompts or input validation"
+        },
+        {
+            "name": "Ignore previous instructions pattern",
+            "regex": r"ignore (previous|all|above) instructions",
+            "description": "Prompt contains instruction override attempt",
+            "remediation": "Filter out instruction override attempts"
+        },
+        {
+            "name": "System prompt override",
+            "regex": r"(you are now|forget (everything|all)|new instructions|disregard)",
+            "description": "Attempt to override system prompt",
+            "remediation": "Implement prompt validation and filtering"
+        },
+    )
+]
+
+
 class AuditorEnhanced:
     """
     Enhanced security auditor with SOC2, OWASP, prompt injection
@@ -100,6 +424,23 @@ class AuditorEnhanced:
         # Prompt injection patterns
         self.prompt_injection_patterns = self._initialize_prompt_injection_patterns()
 
+        # Dependency scan results keyed by manifest content hash (loaded lazily)
+        self._dep_cache_path = self.output_dir / "dep_cache.json"
+        self._dep_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._dep_cache_dirty = False
+
+        # Dependency scan results for this auditor keyed by (path, mtime_ns, size),
+        # so repeat audits skip reading and hashing unchanged manifests
+        self._dep_stat_cache: Dict[Tuple[str, int, int], List[DependencyVulnerability]] = {}
+
+        # Per-file scanners keyed by the (owasp, prompt_injection, secrets) flags
+        self._scan_plan_cache: Dict[Tuple[bool, bool, bool], Tuple[_FileScan, ...]] = {}
+
+        # Rendered soc2_compliance report section, rebuilt only when an audit changes
+        # a control's status or findings (tracked by _soc2_version)
+        self._soc2_version = 0
+        self._soc2_rendered: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
+
     def comprehensive_audit(
         self,
         include_soc2: bool = True,
@@ -116,42 +457,72 @@ class AuditorEnhanced:
         """
         self.logger.info("Starting comprehensive security audit")
 
-        issues: List[SecurityIssue] = []
-
-        # SOC2 compliance check
-        if include_soc2:
-            self.logger.info("Running SOC2 compliance audit")
-            soc2_results = self.audit_soc2_compliance()
-            issues.extend(soc2_results["issues"])
-
-        # OWASP Top 10 scan
-        if include_owasp:
-            self.logger.info("Running OWASP Top 10 scan")
-            owasp_results = self.scan_owasp_top10()
-            issues.extend(owasp_results)
-
-        # Prompt injection detection
-        if include_prompt_injection:
-            self.logger.info("Running prompt injection detection")
-            prompt_issues = self.detect_prompt_injection()
-            issues.extend(prompt_issues)
-
-        # Dependency vulnerabilities
-        if include_dependencies:
-            self.logger.info("Scanning dependencies for vulnerabilities")
-            dep_issues = self.scan_dependencies()
-            issues.extend(dep_issues)
-
-        # Secret detection
-        if include_secrets:
-            self.logger.info("Scanning for exposed secrets")
-            secret_issues = self.scan_secrets()
-            issues.extend(secret_issues)
+        # OWASP, prompt injection and secret scans share one walk and one read per file
+        plan = self._scan_plan(include_owasp, include_prompt_injection, include_secrets)
+
+        # Issues stream from each scanner straight into the report
+        issues = chain(
+            self._iter_soc2_issues() if include_soc2 else (),
+            self._iter_file_issues(plan),
+            self.scan_dependencies() if include_dependencies else ()
+        )
 
         # Generate report
         report = self._generate_audit_report(issues)
 
-        self.logger.info(f"Audit complete: {len(issues)} issues found")
+        self.logger.info(f"Audit complete: {report['summary']['total_issues']} issues found")
+
+        return report
+
+    async def comprehensive_audit_async(
+        self,
+        include_soc2: bool = True,
+        include_owasp: bool = True,
+        include_prompt_injection: bool = True,
+        include_dependencies: bool = True,
+        include_secrets: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Run comprehensive security audit with concurrent file reads
+
+        Produces the same findings as comprehensive_audit, but every source
+        file is read once, concurrently, before the byte scanners run over the
+        in-memory contents. Worthwhile on network filesystems where blocking
+        reads serialize on latency. The dependency scan runs in a worker
+        thread alongside the reads.
+
+        Returns:
+            Complete audit report with all findings
+        """
+        self.logger.info("Starting comprehensive security audit (async)")
+
+        plan = self._scan_plan(include_owasp, include_prompt_injection, include_secrets)
+        planned_files = list(self._iter_plan_files(plan))
+
+        dep_task = asyncio.create_task(
+            asyncio.to_thread(lambda: list(self.scan_dependencies()))
+        ) if include_dependencies else None
+
+        contents = await read_files_async(
+            (file_path for file_path, _ in planned_files), max((scan.max_bytes for scan in plan), default=0)
+        )
+
+        file_issues = (
+            issue
+            for file_path, scans in planned_files if file_path in contents
+            for scan in scans
+            for issue in scan.check(filter_scannable(file_path, contents[file_path], scan.max_bytes), file_path)
+        )
+
+        issues = chain(
+            self._iter_soc2_issues() if include_soc2 else (),
+            file_issues,
+            await dep_task if dep_task is not None else ()
+        )
+
+        report = self._generate_audit_report(issues)
+
+        self.logger.info(f"Audit complete: {report['summary']['total_issues']} issues found")
 
         return report
 
@@ -183,8 +554,12 @@ class AuditorEnhanced:
             else:
                 continue
 
-            control.findings = [issue.description for issue in control_issues]
-            control.compliance_status = "non_compliant" if control_issues else "compliant"
+            findings = [issue.description for issue in control_issues]
+            status = "non_compliant" if control_issues else "compliant"
+            if findings != control.findings or status != control.compliance_status:
+                control.findings = findings
+                control.compliance_status = status
+                self._soc2_version += 1
 
             issues.extend(control_issues)
 
@@ -195,334 +570,254 @@ class AuditorEnhanced:
             "total_controls": len(self.soc2_controls)
         }
 
-    def scan_owasp_top10(self) -> List[SecurityIssue]:
-        """Scan for OWASP Top 10 vulnerabilities"""
-        issues = []
-
-        # Find all code files
-        code_files = list(self.project_root.rglob("*.py")) + \
-                    list(self.project_root.rglob("*.js")) + \
-                    list(self.project_root.rglob("*.ts")) + \
-                    list(self.project_root.rglob("*.tsx"))
-
-        for file_path in code_files:
-            if "node_modules" in str(file_path) or ".git" in str(file_path):
-                continue
+    def _iter_soc2_issues(self) -> Iterator[SecurityIssue]:
+        """SOC2 compliance issues, auditing the controls when first consumed"""
+        yield from self.audit_soc2_compliance()["issues"]
 
-            try:
-                content = file_path.read_text()
-
-                # A01: Broken Access Control
-                issues.extend(self._check_broken_access_control(content, file_path))
+    def scan_owasp_top10(self) -> Iterator[SecurityIssue]:
+        """Scan for OWASP Top 10 vulnerabilities"""
+        return self._iter_file_issues(self._scan_plan(True, False, False))
 
-                # A02: Cryptographic Failures
-                issues.extend(self._check_crypto_failures(content, file_path))
+    def detect_prompt_injection(self) -> Iterator[SecurityIssue]:
+        """Detect prompt injection vulnerabilities in LLM integrations"""
+        return self._iter_file_issues(self._scan_plan(False, True, False))
 
-                # A03: Injection
-                issues.extend(self._check_injection(content, file_path))
+    def scan_dependencies(self) -> Iterator[SecurityIssue]:
+        """Scan dependencies for known vulnerabilities"""
+        # Persist in finally so a consumer that stops early still saves what was checked
+        try:
+            # Check Python dependencies (requirements.txt, pyproject.toml)
+            requirements_files = self._project_files("requirements*.txt", "pyproject.toml")
+
+            for req_file in requirements_files:
+                vulnerabilities = self._cached_dependency_check(req_file, "pypi", self._check_python_dependencies)
+
+                for vuln in vulnerabilities:
+                    yield SecurityIssue(
+                        severity=vuln.severity,
+                        category="dependency",
+                        title=f"Vulnerable dependency: {vuln.package_name}",
+                        description=f"{vuln.description} (CVE: {vuln.cve_id})",
+                        file_path=str(req_file),
+                        cve_id=vuln.cve_id,
+                        remediation=f"Update {vuln.package_name} to version {vuln.fixed_version or 'latest'}"
+                    )
+
+            # Check JavaScript dependencies (package.json)
+            package_jsons = self._project_files("package.json")
+
+            for pkg_file in package_jsons:
+                vulnerabilities = self._cached_dependency_check(pkg_file, "npm", self._check_npm_dependencies)
+
+                for vuln in vulnerabilities:
+                    yield SecurityIssue(
+                        severity=vuln.severity,
+                        category="dependency",
+                        title=f"Vulnerable npm package: {vuln.package_name}",
+                        description=f"{vuln.description} (CVE: {vuln.cve_id})",
+                        file_path=str(pkg_file),
+                        cve_id=vuln.cve_id,
+                        remediation=f"Update {vuln.package_name} to version {vuln.fixed_version or 'latest'}"
+                    )
+        finally:
+            self._save_dep_cache()
+
+    def scan_secrets(self) -> Iterator[SecurityIssue]:
+        """Scan for exposed secrets and credentials"""
+        return self._iter_file_issues(self._scan_plan(False, False, True))
 
-                # A05: Security Misconfiguration
-                issues.extend(self._check_security_misconfig(content, file_path))
+    # Private helper methods
 
-                # A07: XSS
-                issues.extend(self._check_xss(content, file_path))
+    def _scan_plan(
+        self, include_owasp: bool, include_prompt_injection: bool, include_secrets: bool
+    ) -> Tuple[_FileScan, ...]:
+        """Per-file scanners enabled by the audit flags, built once per flag set"""
+        key = (include_owasp, include_prompt_injection, include_secrets)
+        plan = self._scan_plan_cache.get(key)
+
+        if plan is None:
+            candidates = (
+                (include_owasp, _FileScan(
+                    "owasp", _OWASP_GLOBS, _MAX_CODE_FILE_BYTES, self._check_owasp_file
+                )),
+                (include_prompt_injection, _FileScan(
+                    "prompt_injection", _PROMPT_INJECTION_GLOBS, _MAX_CODE_FILE_BYTES, self._check_prompt_injection_file
+                )),
+                (include_secrets, _FileScan(
+                    "secrets", _SECRET_GLOBS, _MAX_SECRET_FILE_BYTES, self._check_secrets_file, is_dotenv
+                )),
+            )
+            plan = tuple(scan for enabled, scan in candidates if enabled)
+            self._scan_plan_cache[key] = plan
 
-                # A08: Insecure Deserialization
-                issues.extend(self._check_insecure_deserialization(content, file_path))
+        return plan
 
-            except Exception as e:
-                self.logger.warning(f"Error scanning {file_path}: {e}")
+    def _iter_plan_files(self, plan: Tuple[_FileScan, ...]) -> Iterator[Tuple[Path, Tuple[_FileScan, ...]]]:
+        """
+        Walk the project once, yielding each admitted file with the planned scanners that want it
 
-        return issues
+        Files come in walk order; each is lstat'ed at most once and only
+        scanners whose size limit it fits are kept.
+        """
+        if not plan:
+            return
 
-    def detect_prompt_injection(self) -> List[SecurityIssue]:
-        """Detect prompt injection vulnerabilities in LLM integrations"""
-        issues = []
+        matchers = [glob_matcher(*scan.patterns) for scan in plan]
 
-        # Find files with LLM API calls
-        code_files = list(self.project_root.rglob("*.py")) + \
-                    list(self.project_root.rglob("*.js")) + \
-                    list(self.project_root.rglob("*.ts"))
+        for file_path in walk_files(self.project_root):
+            name = file_path.name
+            wanted = [
+                scan for scan, match in zip(plan, matchers)
+                if match(name) and not (scan.exclude is not None and scan.exclude(name))
+            ]
+            if not wanted:
+                continue
 
-        for file_path in code_files:
-            if "node_modules" in str(file_path) or ".git" in str(file_path):
+            size = readable_size(file_path)
+            if size is None:
                 continue
 
+            scans = tuple(scan for scan in wanted if scan.max_bytes is None or size <= scan.max_bytes)
+            if scans:
+                yield file_path, scans
+
+    def _iter_file_issues(self, plan: Tuple[_FileScan, ...]) -> Iterator[SecurityIssue]:
+        """Run every scanner in a plan, opening each file once and yielding its issues file by file"""
+        for file_path, scans in self._iter_plan_files(plan):
             try:
-                content = file_path.read_text()
+                with open_for_scan(file_path, max(scan.max_bytes for scan in scans)) as content:
+                    file_issues = [issue for scan in scans for issue in scan.check(content, file_path)]
 
-                # Check for LLM API usage
-                if not self._has_llm_api_call(content):
-                    continue
+            except Exception as e:
+                self.logger.warning(f"Error scanning {file_path}: {e}")
+                continue
 
-                # Check for input sanitization
-                if not self._has_input_sanitization(content):
-                    issues.append(SecurityIssue(
-                        severity="high",
-                        category="prompt_injection",
-                        title="Missing input sanitization before LLM call",
-                        description="User input passed to LLM without sanitization/validation",
-                        file_path=str(file_path),
-                        remediation="Implement input validation and sanitization before LLM API calls",
-                        code_example="# Sanitize user input\nuser_input = sanitize_input(user_input)\nprompt = f'Task: {user_input}'"
-                    ))
+            yield from file_issues
 
-                # Check for prompt injection indicators
-                for pattern in self.prompt_injection_patterns:
-                    if re.search(pattern["regex"], content, re.IGNORECASE):
-                        issues.append(SecurityIssue(
-                            severity="high",
-                            category="prompt_injection",
-                            title=f"Potential prompt injection: {pattern['name']}",
-                            description=pattern["description"],
-                            file_path=str(file_path),
-                            remediation=pattern["remediation"]
-                        ))
-
-                # Check for output validation
-                if not self._has_output_validation(content):
-                    issues.append(SecurityIssue(
-                        severity="medium",
-                        category="prompt_injection",
-                        title="Missing output validation from LLM",
-                        description="LLM output not validated before use",
-                        file_path=str(file_path),
-                        remediation="Validate and sanitize LLM outputs before execution/display"
-                    ))
+    def _project_files(self, *patterns: str, max_bytes: Optional[int] = None) -> List[Path]:
+        """Readable files matching any filename glob, outside skipped directories"""
+        return [file_path for file_path, _ in self._iter_plan_files((_FileScan("files", patterns, max_bytes),))]
 
-            except Exception as e:
-                self.logger.warning(f"Error checking {file_path}: {e}")
+    def _iter_globs(self, *patterns: str) -> Iterator[Path]:
+        """Lazily yield files matching any filename glob, so callers can stop early"""
+        match = glob_matcher(*patterns)
+        return (file_path for file_path in walk_files(self.project_root) if match(file_path.name))
 
-        return issues
+    def _any_file_matches(self, paths: Iterable[Path], pattern, limit: Optional[int] = None) -> bool:
+        """
+        Check whether pattern occurs in any of the first limit readable paths
 
-    def scan_dependencies(self) -> List[SecurityIssue]:
-        """Scan dependencies for known vulnerabilities"""
+        Files are streamed in 64 KiB chunks and the search returns on the
+        first hit, so neither remaining files nor the rest of a large file
+        are read once the signal is found.
+        """
+        for file_path in islice((path for path in paths if is_readable_file(path)), limit):
+            try:
+                if any(pattern.search(chunk) for chunk in iter_chunks(file_path, overlap=_SIGNAL_OVERLAP)):
+                    return True
+            except OSError as e:
+                self.logger.debug(f"Skipping {file_path}: {e}")
+        return False
+
+    def _check_prompt_injection_file(self, content: Buffer, file_path: Path) -> List[SecurityIssue]:
+        """Check one file's LLM integration for prompt injection exposure"""
         issues = []
 
-        # Check Python dependencies (requirements.txt, pyproject.toml)
-        requirements_files = list(self.project_root.rglob("requirements*.txt")) + \
-                           list(self.project_root.rglob("pyproject.toml"))
+        # Check for LLM API usage
+        if not self._has_llm_api_call(content):
+            return issues
 
-        for req_file in requirements_files:
-            vulnerabilities = self._check_python_dependencies(req_file)
+        # Check for input sanitization
+        if not self._has_input_sanitization(content):
+            issues.append(SecurityIssue(
+                severity="high",
+                category="prompt_injection",
+                title="Missing input sanitization before LLM call",
+                description="User input passed to LLM without sanitization/validation",
+                file_path=str(file_path),
+                remediation="Implement input validation and sanitization before LLM API calls",
+                code_example="# Sanitize user input\nuser_input = sanitize_input(user_input)\nprompt = f'Task: {user_input}'"
+            ))
 
-            for vuln in vulnerabilities:
+        # Check for prompt injection indicators
+        line_index = LineIndex(content)
+        for pattern in self.prompt_injection_patterns:
+            match = pattern["compiled"].search(content)
+            if match:
                 issues.append(SecurityIssue(
-                    severity=vuln.severity,
-                    category="dependency",
-                    title=f"Vulnerable dependency: {vuln.package_name}",
-                    description=f"{vuln.description} (CVE: {vuln.cve_id})",
-                    file_path=str(req_file),
-                    cve_id=vuln.cve_id,
-                    remediation=f"Update {vuln.package_name} to version {vuln.fixed_version or 'latest'}"
+                    severity="high",
+                    category="prompt_injection",
+                    title=f"Potential prompt injection: {pattern['name']}",
+                    description=pattern["description"],
+                    file_path=str(file_path),
+                    line_number=line_index.line_of(match.start()),
+                    remediation=pattern["remediation"]
                 ))
 
-        # Check JavaScript dependencies (package.json)
-        package_jsons = list(self.project_root.rglob("package.json"))
-
-        for pkg_file in package_jsons:
-            if "node_modules" in str(pkg_file):
-                continue
-
-            vulnerabilities = self._check_npm_dependencies(pkg_file)
-
-            for vuln in vulnerabilities:
-                issues.append(SecurityIssue(
-                    severity=vuln.severity,
-                    category="dependency",
-                    title=f"Vulnerable npm package: {vuln.package_name}",
-                    description=f"{vuln.description} (CVE: {vuln.cve_id})",
-                    file_path=str(pkg_file),
-                    cve_id=vuln.cve_id,
-                    remediation=f"Update {vuln.package_name} to version {vuln.fixed_version or 'latest'}"
-                ))
+        # Check for output validation
+        if not self._has_output_validation(content):
+            issues.append(SecurityIssue(
+                severity="medium",
+                category="prompt_injection",
+                title="Missing output validation from LLM",
+                description="LLM output not validated before use",
+                file_path=str(file_path),
+                remediation="Validate and sanitize LLM outputs before execution/display"
+            ))
 
         return issues
 
-    def scan_secrets(self) -> List[SecurityIssue]:
-        """Scan for exposed secrets and credentials"""
+    def _check_secrets_file(self, data: Buffer, file_path: Path) -> List[SecurityIssue]:
+        """Report every secret pattern match in one file"""
         issues = []
 
-        secret_patterns = [
-            (r'(?i)(api[_-]?key|apikey)["\']?\s*[:=]\s*["\']([a-zA-Z0-9_\-]{20,})["\']', "API Key"),
-            (r'(?i)(password|passwd|pwd)["\']?\s*[:=]\s*["\']([^"\']{8,})["\']', "Password"),
-            (r'(?i)(secret|token)["\']?\s*[:=]\s*["\']([a-zA-Z0-9_\-]{20,})["\']', "Secret/Token"),
-            (r'-----BEGIN (RSA |EC )?PRIVATE KEY-----', "Private Key"),
-            (r'(?i)aws[_-]?access[_-]?key[_-]?id["\']?\s*[:=]\s*["\']([A-Z0-9]{20})["\']', "AWS Access Key"),
-            (r'(?i)sk_live_[a-zA-Z0-9]{24,}', "Stripe Live Key"),
-        ]
+        # Only run the patterns whose literal triggers occur in the file
+        candidates = tuple(sorted(_SECRET_PRESCREEN.hits(data)))
+        if not candidates:
+            return issues
 
-        # Scan all text files
-        text_files = list(self.project_root.rglob("*.py")) + \
-                    list(self.project_root.rglob("*.js")) + \
-                    list(self.project_root.rglob("*.ts")) + \
-                    list(self.project_root.rglob("*.env*")) + \
-                    list(self.project_root.rglob("*.json")) + \
-                    list(self.project_root.rglob("*.yaml")) + \
-                    list(self.project_root.rglob("*.yml"))
-
-        for file_path in text_files:
-            if "node_modules" in str(file_path) or ".git" in str(file_path):
-                continue
+        line_index = LineIndex(data)
 
-            # Skip if in .gitignore
-            if file_path.name == ".env" or file_path.name.startswith(".env."):
-                continue  # .env files are expected to have secrets (should be in .gitignore)
+        for subset_index, start, _end in _secret_matcher(candidates).scan(data):
+            secret_type = _SECRET_PATTERNS[candidates[subset_index]][2]
+            line_num = line_index.line_of(start)
 
-            try:
-                content = file_path.read_text()
-
-                for pattern, secret_type in secret_patterns:
-                    matches = re.finditer(pattern, content)
-
-                    for match in matches:
-                        line_num = content[:match.start()].count('\n') + 1
-
-                        issues.append(SecurityIssue(
-                            severity="critical",
-                            category="secret",
-                            title=f"Exposed {secret_type}",
-                            description=f"Hardcoded {secret_type.lower()} found in source code",
-                            file_path=str(file_path),
-                            line_number=line_num,
-                            remediation=f"Remove hardcoded {secret_type.lower()} and use environment variables"
-                        ))
-
-            except Exception as e:
-                self.logger.warning(f"Error scanning {file_path}: {e}")
+            issues.append(SecurityIssue(
+                severity="critical",
+                category="secret",
+                title=f"Exposed {secret_type}",
+                description=f"Hardcoded {secret_type.lower()} found in source code",
+                file_path=str(file_path),
+                line_number=line_num,
+                remediation=f"Remove hardcoded {secret_type.lower()} and use environment variables"
+            ))
 
         return issues
 
-    # Private helper methods
-
     def _initialize_soc2_controls(self) -> Dict[str, SOC2Control]:
-        """Initialize SOC2 Type II controls"""
+        """Initialize SOC2 Type II controls with empty per-run results"""
         return {
-            "CC6.1": SOC2Control(
-                control_id="CC6.1",
-                name="Logical and Physical Access Controls",
-                category="access_control",
-                description="Implements controls to prevent unauthorized access",
-                requirements=[
-                    "Authentication mechanisms",
-                    "Authorization controls",
-                    "Role-based access control (RBAC)",
-                    "Multi-factor authentication (MFA)",
-                    "Session management"
-                ],
-                validation_steps=[
-                    "Check for authentication middleware",
-                    "Verify RBAC implementation",
-                    "Validate MFA support",
-                    "Review session timeout configuration"
-                ]
-            ),
-            "CC6.6": SOC2Control(
-                control_id="CC6.6",
-                name="Encryption of Data",
-                category="encryption",
-                description="Encrypts data in transit and at rest",
-                requirements=[
-                    "TLS/SSL for data in transit",
-                    "Encryption at rest for sensitive data",
-                    "Strong encryption algorithms (AES-256)",
-                    "Secure key management"
-                ],
-                validation_steps=[
-                    "Check HTTPS enforcement",
-                    "Verify database encryption",
-                    "Validate encryption algorithm strength",
-                    "Review key storage mechanisms"
-                ]
-            ),
-            "CC6.7": SOC2Control(
-                control_id="CC6.7",
-                name="Transmission of Data",
-                category="encryption",
-                description="Protects data during transmission",
-                requirements=[
-                    "HTTPS/TLS for all external communication",
-                    "Certificate validation",
-                    "Secure protocols (TLS 1.2+)",
-                    "HSTS headers"
-                ],
-                validation_steps=[
-                    "Check for HTTPS-only communication",
-                    "Verify TLS version >= 1.2",
-                    "Validate HSTS implementation",
-                    "Check for mixed content"
-                ]
-            ),
-            "CC7.2": SOC2Control(
-                control_id="CC7.2",
-                name="Detection and Monitoring",
-                category="monitoring",
-                description="Detects and responds to security events",
-                requirements=[
-                    "Logging of security events",
-                    "Monitoring and alerting",
-                    "Incident response procedures",
-                    "Anomaly detection"
-                ],
-                validation_steps=[
-                    "Check logging implementation",
-                    "Verify monitoring tools",
-                    "Review alert configurations",
-                    "Validate incident response plan"
-                ]
-            )
+            control_id: replace(control, compliance_status="not_checked", findings=[], evidence=[])
+            for control_id, control in _SOC2_CONTROLS.items()
         }
 
     def _initialize_owasp_patterns(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Initialize OWASP Top 10 detection patterns"""
-        return {
-            "sql_injection": [
-                {"regex": r"execute\(.*\+.*\)", "desc": "String concatenation in SQL query"},
-                {"regex": r"query\(.*f['\"].*{.*}.*['\"]", "desc": "F-string in SQL query"},
-            ],
-            "xss": [
-                {"regex": r"innerHTML\s*=\s*.*", "desc": "Direct innerHTML assignment"},
-                {"regex": r"dangerouslySetInnerHTML", "desc": "Dangerous HTML insertion"},
-            ],
-            "broken_auth": [
-                {"regex": r"password.*==.*['\"]", "desc": "Hardcoded password comparison"},
-                {"regex": r"jwt.*verify.*verify:\s*false", "desc": "JWT verification disabled"},
-            ]
-        }
+        """Initialize OWASP Top 10 detection patterns (shared, read-only)"""
+        return _OWASP_PATTERNS
 
     def _initialize_prompt_injection_patterns(self) -> List[Dict[str, Any]]:
-        """Initialize prompt injection detection patterns"""
-        return [
-            {
-                "name": "Direct user input in prompt",
-                "regex": r"(prompt|messages)\s*=\s*.*\+\s*(user_input|request\.|input\()",
-                "description": "User input directly concatenated into LLM prompt",
-                "remediation": "Use parameterized prompts or input validation"
-            },
-            {
-                "name": "Ignore previous instructions pattern",
-                "regex": r"ignore (previous|all|above) instructions",
-                "description": "Prompt contains instruction override attempt",
-                "remediation": "Filter out instruction override attempts"
-            },
-            {
-                "name": "System prompt override",
-                "regex": r"(you are now|forget (everything|all)|new instructions|disregard)",
-                "description": "Attempt to override system prompt",
-                "remediation": "Implement prompt validation and filtering"
-            }
-        ]
+        """Initialize prompt injection detection patterns (shared, read-only)"""
+        return _PROMPT_INJECTION_PATTERNS
 
     def _audit_cc61_access_control(self) -> List[SecurityIssue]:
         """Audit CC6.1: Access Control"""
         issues = []
 
-        # Check for authentication
-        auth_files = list(self.project_root.rglob("*auth*.py")) + \
-                     list(self.project_root.rglob("*auth*.js")) + \
-                     list(self.project_root.rglob("*auth*.ts"))
+        # Check for authentication (first match is enough, the walk stops there)
+        auth_files = self._iter_globs("*auth*.py", "*auth*.js", "*auth*.ts")
+        first_auth_file = next(auth_files, None)
 
-        if not auth_files:
+        if first_auth_file is None:
             issues.append(SecurityIssue(
                 severity="high",
                 category="soc2",
@@ -531,18 +826,10 @@ class AuditorEnhanced:
                 remediation="Implement authentication (JWT, OAuth, etc.)"
             ))
 
-        # Check for RBAC
-        rbac_keywords = ["role", "permission", "authorize", "can_access"]
-        has_rbac = False
-
-        for auth_file in auth_files[:5]:  # Check first 5 auth files
-            try:
-                content = auth_file.read_text()
-                if any(keyword in content.lower() for keyword in rbac_keywords):
-                    has_rbac = True
-                    break
-            except:
-                pass
+        # Check for RBAC in the first 5 readable auth files
+        has_rbac = first_auth_file is not None and self._any_file_matches(
+            chain((first_auth_file,), auth_files), _RBAC_RE, limit=5
+        )
 
         if not has_rbac:
             issues.append(SecurityIssue(
@@ -560,19 +847,8 @@ class AuditorEnhanced:
         issues = []
 
         # Check for HTTPS enforcement
-        config_files = list(self.project_root.rglob("*.config.js")) + \
-                      list(self.project_root.rglob("settings.py")) + \
-                      list(self.project_root.rglob(".env*"))
-
-        has_https = False
-        for config_file in config_files:
-            try:
-                content = config_file.read_text()
-                if "https" in content.lower() or "ssl" in content.lower():
-                    has_https = True
-                    break
-            except:
-                pass
+        config_files = self._iter_globs("*.config.js", "settings.py", ".env*")
+        has_https = self._any_file_matches(config_files, _HTTPS_CONFIG_RE)
 
         if not has_https:
             issues.append(SecurityIssue(
@@ -590,27 +866,30 @@ class AuditorEnhanced:
         issues = []
 
         # Check for HTTP URLs in code
-        code_files = list(self.project_root.rglob("*.py"))[:20] + \
-                     list(self.project_root.rglob("*.js"))[:20]
+        code_files = list(islice(self._iter_globs("*.py"), 20)) + list(islice(self._iter_globs("*.js"), 20))
 
         for code_file in code_files:
-            if "node_modules" in str(code_file):
+            if not is_readable_file(code_file, _MAX_CODE_FILE_BYTES):
                 continue
 
             try:
-                content = code_file.read_text()
-                if re.search(r'http://(?!localhost|127\.0\.0\.1)', content):
+                with open_for_scan(code_file, _MAX_CODE_FILE_BYTES) as content:
+                    match = _HTTP_URL_RE.search(content) if content.find(b"http://", 0) != -1 else None
+                    line_num = LineIndex(content).line_of(match.start()) if match else None
+
+                if match:
                     issues.append(SecurityIssue(
                         severity="medium",
                         category="soc2",
                         title="CC6.7: HTTP URL in code",
                         description=f"Insecure HTTP URL found in {code_file.name}",
                         file_path=str(code_file),
+                        line_number=line_num,
                         remediation="Use HTTPS for external URLs"
                     ))
                     break  # One example is enough
-            except:
-                pass
+            except OSError as e:
+                self.logger.debug(f"Skipping {code_file}: {e}")
 
         return issues
 
@@ -619,10 +898,9 @@ class AuditorEnhanced:
         issues = []
 
         # Check for logging
-        log_files = list(self.project_root.rglob("*log*.py")) + \
-                   list(self.project_root.rglob("*logger*.js"))
+        has_logging = next(self._iter_globs("*log*.py", "*logger*.js"), None) is not None
 
-        if not log_files:
+        if not has_logging:
             issues.append(SecurityIssue(
                 severity="medium",
                 category="soc2",
@@ -633,184 +911,277 @@ class AuditorEnhanced:
 
         return issues
 
-    def _check_broken_access_control(self, content: str, file_path: Path) -> List[SecurityIssue]:
+    def _check_owasp_file(self, content: Buffer, file_path: Path) -> List[SecurityIssue]:
+        """Run every OWASP check over one file with a single regex pass"""
+        hits = self._owasp_hits(content)
+        if not hits:
+            return []
+
+        line_index = LineIndex(content)
+        issues = []
+
+        # A01: Broken Access Control
+        issues.extend(self._check_broken_access_control(content, file_path, hits, line_index))
+
+        # A02: Cryptographic Failures
+        issues.extend(self._check_crypto_failures(content, file_path, hits, line_index))
+
+        # A03: Injection
+        issues.extend(self._check_injection(content, file_path, hits, line_index))
+
+        # A05: Security Misconfiguration
+        issues.extend(self._check_security_misconfig(content, file_path, hits, line_index))
+
+        # A07: XSS
+        issues.extend(self._check_xss(content, file_path, hits, line_index))
+
+        # A08: Insecure Deserialization
+        issues.extend(self._check_insecure_deserialization(content, file_path, hits, line_index))
+
+        return issues
+
+    def _owasp_hits(self, content: Buffer) -> Dict[str, int]:
+        """Map each OWASP detector matching in content to the offset of its first match"""
+        candidates = _OWASP_PRESCREEN.hits(content)
+        if not candidates:
+            return {}
+
+        hits = {}
+        for match in _owasp_regex(frozenset(candidates)).finditer(content):
+            hits.setdefault(match.lastgroup, match.start())
+            if len(hits) == len(candidates):
+                break
+        return hits
+
+    def _check_broken_access_control(
+        self,
+        content: Union[str, Buffer],
+        file_path: Path,
+        hits: Optional[Dict[str, int]] = None,
+        line_index: Optional[LineIndex] = None
+    ) -> List[SecurityIssue]:
         """Check for broken access control (OWASP A01)"""
+        content = _as_buffer(content)
+        hits = self._owasp_hits(content) if hits is None else hits
+        line_index = LineIndex(content) if line_index is None else line_index
         issues = []
 
         # Check for missing authorization
-        if re.search(r'@app\.(get|post|put|delete)', content) and \
-           not re.search(r'@(require_auth|login_required|authorize)', content):
+        if "endpoint" in hits and "auth_decorator" not in hits:
             issues.append(SecurityIssue(
                 severity="high",
                 category="owasp",
                 title="A01: Missing authorization on endpoint",
                 description="API endpoint without authorization check",
                 file_path=str(file_path),
+                line_number=line_index.line_of(hits["endpoint"]),
                 cwe_id="CWE-862",
                 remediation="Add authorization decorator/middleware"
             ))
 
         return issues
 
-    def _check_crypto_failures(self, content: str, file_path: Path) -> List[SecurityIssue]:
+    def _check_crypto_failures(
+        self,
+        content: Union[str, Buffer],
+        file_path: Path,
+        hits: Optional[Dict[str, int]] = None,
+        line_index: Optional[LineIndex] = None
+    ) -> List[SecurityIssue]:
         """Check for cryptographic failures (OWASP A02)"""
+        content = _as_buffer(content)
+        hits = self._owasp_hits(content) if hits is None else hits
+        line_index = LineIndex(content) if line_index is None else line_index
         issues = []
 
         # Weak hashing algorithms
-        if re.search(r'hashlib\.(md5|sha1)', content):
+        if "weak_hash" in hits:
             issues.append(SecurityIssue(
                 severity="high",
                 category="owasp",
                 title="A02: Weak cryptographic hash",
                 description="MD5/SHA1 used (consider SHA-256+)",
                 file_path=str(file_path),
+                line_number=line_index.line_of(hits["weak_hash"]),
                 cwe_id="CWE-327",
                 remediation="Use SHA-256 or bcrypt for passwords"
             ))
 
         return issues
 
-    def _check_injection(self, content: str, file_path: Path) -> List[SecurityIssue]:
+    def _check_injection(
+        self,
+        content: Union[str, Buffer],
+        file_path: Path,
+        hits: Optional[Dict[str, int]] = None,
+        line_index: Optional[LineIndex] = None
+    ) -> List[SecurityIssue]:
         """Check for injection vulnerabilities (OWASP A03)"""
+        content = _as_buffer(content)
+        hits = self._owasp_hits(content) if hits is None else hits
+        line_index = LineIndex(content) if line_index is None else line_index
         issues = []
 
         # SQL injection
-        if re.search(r'execute\(.*\+|cursor\.execute\(f["\']', content):
+        if "sql_injection" in hits:
             issues.append(SecurityIssue(
                 severity="critical",
                 category="owasp",
                 title="A03: SQL Injection risk",
                 description="SQL query with string concatenation",
                 file_path=str(file_path),
+                line_number=line_index.line_of(hits["sql_injection"]),
                 cwe_id="CWE-89",
                 remediation="Use parameterized queries"
             ))
 
         # Command injection
-        if re.search(r'os\.(system|popen|exec)', content) and '+' in content:
+        if "os_command" in hits and b'+' in content:
             issues.append(SecurityIssue(
                 severity="critical",
                 category="owasp",
                 title="A03: Command Injection risk",
                 description="OS command with user input",
                 file_path=str(file_path),
+                line_number=line_index.line_of(hits["os_command"]),
                 cwe_id="CWE-78",
                 remediation="Avoid shell commands or use subprocess with shell=False"
             ))
 
         return issues
 
-    def _check_security_misconfig(self, content: str, file_path: Path) -> List[SecurityIssue]:
+    def _check_security_misconfig(
+        self,
+        content: Union[str, Buffer],
+        file_path: Path,
+        hits: Optional[Dict[str, int]] = None,
+        line_index: Optional[LineIndex] = None
+    ) -> List[SecurityIssue]:
         """Check for security misconfiguration (OWASP A05)"""
+        content = _as_buffer(content)
+        hits = self._owasp_hits(content) if hits is None else hits
+        line_index = LineIndex(content) if line_index is None else line_index
         issues = []
 
         # Debug mode in production
-        if re.search(r'DEBUG\s*=\s*True|debug:\s*true', content):
+        if "debug_mode" in hits:
             issues.append(SecurityIssue(
                 severity="medium",
                 category="owasp",
                 title="A05: Debug mode enabled",
                 description="Debug mode should be disabled in production",
                 file_path=str(file_path),
+                line_number=line_index.line_of(hits["debug_mode"]),
                 remediation="Set DEBUG=False in production"
             ))
 
         return issues
 
-    def _check_xss(self, content: str, file_path: Path) -> List[SecurityIssue]:
+    def _check_xss(
+        self,
+        content: Union[str, Buffer],
+        file_path: Path,
+        hits: Optional[Dict[str, int]] = None,
+        line_index: Optional[LineIndex] = None
+    ) -> List[SecurityIssue]:
         """Check for XSS vulnerabilities (OWASP A07)"""
+        content = _as_buffer(content)
+        hits = self._owasp_hits(content) if hits is None else hits
+        line_index = LineIndex(content) if line_index is None else line_index
         issues = []
 
-        if re.search(r'innerHTML\s*=|dangerouslySetInnerHTML', content):
+        if "xss" in hits:
             issues.append(SecurityIssue(
                 severity="high",
                 category="owasp",
                 title="A07: XSS risk",
                 description="Direct HTML injection possible",
                 file_path=str(file_path),
+                line_number=line_index.line_of(hits["xss"]),
                 cwe_id="CWE-79",
                 remediation="Use textContent or sanitize HTML"
             ))
 
         return issues
 
-    def _check_insecure_deserialization(self, content: str, file_path: Path) -> List[SecurityIssue]:
+    def _check_insecure_deserialization(
+        self,
+        content: Union[str, Buffer],
+        file_path: Path,
+        hits: Optional[Dict[str, int]] = None,
+        line_index: Optional[LineIndex] = None
+    ) -> List[SecurityIssue]:
         """Check for insecure deserialization (OWASP A08)"""
+        content = _as_buffer(content)
+        hits = self._owasp_hits(content) if hits is None else hits
+        line_index = LineIndex(content) if line_index is None else line_index
         issues = []
 
-        if re.search(r'pickle\.loads|yaml\.load\(', content):
+        if "deserialization" in hits:
             issues.append(SecurityIssue(
                 severity="high",
                 category="owasp",
                 title="A08: Insecure deserialization",
                 description="Unsafe deserialization method",
                 file_path=str(file_path),
+                line_number=line_index.line_of(hits["deserialization"]),
                 cwe_id="CWE-502",
                 remediation="Use safe_load for YAML, avoid pickle"
             ))
 
         return issues
 
-    def _has_llm_api_call(self, content: str) -> bool:
+    def _has_llm_api_call(self, content: Union[str, Buffer]) -> bool:
         """Check if file contains LLM API calls"""
-        llm_patterns = [
-            r'openai\.',
-            r'anthropic\.',
-            r'ChatCompletion',
-            r'messages\.create',
-            r'llm\(',
-            r'chat\('
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in llm_patterns)
+        return bool(_LLM_API_PRESCREEN.hits(_as_buffer(content)))
 
-    def _has_input_sanitization(self, content: str) -> bool:
+    def _has_input_sanitization(self, content: Union[str, Buffer]) -> bool:
         """Check for input sanitization"""
-        sanitize_patterns = [
-            r'sanitize',
-            r'validate_input',
-            r'clean_input',
-            r'escape',
-            r'strip_tags'
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in sanitize_patterns)
+        content = _as_buffer(content)
+        return any(pattern.search(content) for pattern in _INPUT_SANITIZATION_RES)
 
-    def _has_output_validation(self, content: str) -> bool:
+    def _has_output_validation(self, content: Union[str, Buffer]) -> bool:
         """Check for output validation"""
-        validate_patterns = [
-            r'validate_output',
-            r'sanitize_output',
-            r'check_response'
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in validate_patterns)
+        content = _as_buffer(content)
+        return any(pattern.search(content) for pattern in _OUTPUT_VALIDATION_RES)
 
     def _check_python_dependencies(self, req_file: Path) -> List[DependencyVulnerability]:
         """Check Python dependencies (simplified - would use CVE database in production)"""
         vulnerabilities = []
 
-        # Known vulnerable packages (example - would query CVE database)
-        known_vulns = {
-            "django": {"versions": "<3.2.0", "cve": "CVE-2021-35042", "severity": "high", "fixed": "3.2.0"},
-            "flask": {"versions": "<2.0.0", "cve": "CVE-2023-30861", "severity": "medium", "fixed": "2.3.0"},
-            "requests": {"versions": "<2.31.0", "cve": "CVE-2023-32681", "severity": "medium", "fixed": "2.31.0"},
-        }
-
         try:
-            content = req_file.read_text()
-
-            for pkg_name, vuln_info in known_vulns.items():
-                if pkg_name in content.lower():
-                    vulnerabilities.append(DependencyVulnerability(
-                        package_name=pkg_name,
-                        current_version="unknown",
-                        vulnerable_versions=vuln_info["versions"],
-                        fixed_version=vuln_info["fixed"],
-                        cve_id=vuln_info["cve"],
-                        severity=vuln_info["severity"],
-                        description=f"Known vulnerability in {pkg_name}",
-                        cvss_score=7.5 if vuln_info["severity"] == "high" else 5.0
-                    ))
-        except:
-            pass
+            # Large manifests are memory-mapped; the prescreen and regex scan the mapping in place
+            with open_for_scan(req_file) as content:
+                if not _PY_VULN_PRESCREEN.hits(content):
+                    return vulnerabilities
+
+                # Declared name -> parsed requirement (None when packaging is absent or the line is unparseable)
+                declared = {
+                    match.group(1).decode().lower(): _parse_requirement(match.group(0)) if Requirement is not None else None
+                    for match in _PY_VULN_RE.finditer(content)
+                }
+
+            for pkg_name in sorted(_PY_KNOWN_VULNS.keys() & declared.keys()):
+                vuln_info = _PY_KNOWN_VULNS[pkg_name]
+                requirement = declared[pkg_name]
+
+                # Only an exact pin outside the vulnerable range clears a package
+                if requirement is not None and _pins_outside(requirement, vuln_info["versions"]):
+                    continue
+
+                specifier = str(requirement.specifier) if requirement is not None else ""
+                vulnerabilities.append(DependencyVulnerability(
+                    package_name=pkg_name,
+                    current_version=specifier or "unknown",
+                    vulnerable_versions=vuln_info["versions"],
+                    fixed_version=vuln_info["fixed"],
+                    cve_id=vuln_info["cve"],
+                    severity=vuln_info["severity"],
+                    description=f"Known vulnerability in {pkg_name}",
+                    cvss_score=7.5 if vuln_info["severity"] == "high" else 5.0
+                ))
+        except OSError as e:
+            self.logger.debug(f"Dependency scan of {req_file} failed: {e}")
 
         return vulnerabilities
 
@@ -818,113 +1189,190 @@ class AuditorEnhanced:
         """Check npm dependencies (simplified)"""
         vulnerabilities = []
 
-        # Known vulnerable npm packages (example)
-        known_vulns = {
-            "axios": {"versions": "<1.6.0", "cve": "CVE-2023-45857", "severity": "medium", "fixed": "1.6.0"},
-            "express": {"versions": "<4.18.0", "cve": "CVE-2022-24999", "severity": "high", "fixed": "4.18.0"},
-        }
+        try:
+            pkg_json = loads_json(pkg_file.read_bytes())
+            if not isinstance(pkg_json, dict):
+                pkg_json = {}
+
+            # Dependency maps that are not JSON objects (null, lists) list no packages
+            dependencies = {}
+            for section in (pkg_json.get("dependencies"), pkg_json.get("devDependencies")):
+                if isinstance(section, dict):
+                    dependencies.update(section)
+
+            # Set intersection of the two key views; sorted for a stable report order
+            for pkg_name in sorted(_NPM_KNOWN_VULNS.keys() & dependencies.keys()):
+                vuln_info = _NPM_KNOWN_VULNS[pkg_name]
+                vulnerabilities.append(DependencyVulnerability(
+                    package_name=pkg_name,
+                    current_version=dependencies[pkg_name],
+                    vulnerable_versions=vuln_info["versions"],
+                    fixed_version=vuln_info["fixed"],
+                    cve_id=vuln_info["cve"],
+                    severity=vuln_info["severity"],
+                    description=f"Known vulnerability in {pkg_name}",
+                    cvss_score=7.5 if vuln_info["severity"] == "high" else 5.0
+                ))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            self.logger.debug(f"Dependency scan of {pkg_file} failed: {e}")
 
+        return vulnerabilities
+
+    def _cached_dependency_check(
+        self,
+        dep_file: Path,
+        ecosystem: str,
+        check: Callable[[Path], List[DependencyVulnerability]]
+    ) -> List[DependencyVulnerability]:
+        """Run a dependency check, reusing the prior result for unchanged manifests"""
         try:
-            content = pkg_file.read_text()
-            pkg_json = json.loads(content)
-
-            dependencies = {**pkg_json.get("dependencies", {}), **pkg_json.get("devDependencies", {})}
-
-            for pkg_name, vuln_info in known_vulns.items():
-                if pkg_name in dependencies:
-                    vulnerabilities.append(DependencyVulnerability(
-                        package_name=pkg_name,
-                        current_version=dependencies[pkg_name],
-                        vulnerable_versions=vuln_info["versions"],
-                        fixed_version=vuln_info["fixed"],
-                        cve_id=vuln_info["cve"],
-                        severity=vuln_info["severity"],
-                        description=f"Known vulnerability in {pkg_name}",
-                        cvss_score=7.5 if vuln_info["severity"] == "high" else 5.0
-                    ))
-        except:
+            st = dep_file.stat()
+            stat_key = (str(dep_file), st.st_mtime_ns, st.st_size)
+            hit = self._dep_stat_cache.get(stat_key)
+            if hit is not None:
+                return list(hit)
+
+            # Hashed in chunks so large manifests are never held whole
+            hasher = hashlib.blake2b(digest_size=16)
+            for chunk in iter_chunks(dep_file):
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
+        except OSError as e:
+            self.logger.warning(f"Error reading {dep_file}: {e}")
+            return []
+
+        cache = self._load_dep_cache()
+        key = f"{ecosystem}:{digest}"
+
+        # An empty list is a valid cached result (no known vulnerabilities)
+        if key in cache:
+            vulnerabilities = [DependencyVulnerability(**vuln) for vuln in cache[key]]
+        else:
+            vulnerabilities = check(dep_file)
+            cache[key] = [asdict(vuln) for vuln in vulnerabilities]
+            self._dep_cache_dirty = True
+
+        self._dep_stat_cache[stat_key] = vulnerabilities
+
+        return list(vulnerabilities)
+
+    def _load_dep_cache(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load the on-disk dependency cache, discarding it if stale or corrupt"""
+        if self._dep_cache is not None:
+            return self._dep_cache
+
+        self._dep_cache = {}
+        try:
+            cached = json.loads(self._dep_cache_path.read_text())
+            if cached.get("version") == _DEP_CACHE_VERSION:
+                self._dep_cache = cached.get("entries", {})
+        except FileNotFoundError:
             pass
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable dependency cache {self._dep_cache_path}: {e}")
 
-        return vulnerabilities
+        return self._dep_cache
 
-    def _generate_audit_report(self, issues: List[SecurityIssue]) -> Dict[str, Any]:
-        """Generate comprehensive audit report"""
+    def _save_dep_cache(self):
+        """Persist the dependency cache if new results were added"""
+        if not self._dep_cache_dirty:
+            return
 
-        # Categorize by severity
-        by_severity = {
-            "critical": [i for i in issues if i.severity == "critical"],
-            "high": [i for i in issues if i.severity == "high"],
-            "medium": [i for i in issues if i.severity == "medium"],
-            "low": [i for i in issues if i.severity == "low"],
-            "info": [i for i in issues if i.severity == "info"]
-        }
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._dep_cache_path.write_text(json.dumps({
+                "version": _DEP_CACHE_VERSION,
+                "entries": self._dep_cache
+            }))
+            self._dep_cache_dirty = False
+        except OSError as e:
+            self.logger.warning(f"Could not save dependency cache: {e}")
+
+    def _generate_audit_report(self, issues: Iterable[SecurityIssue]) -> Dict[str, Any]:
+        """
+        Generate comprehensive audit report in a single pass over issues
+
+        The report keeps the SecurityIssue objects themselves; save_report
+        converts them to JSON entries while serializing.
+        """
+        severity_counts: Counter = Counter()
+        category_counts: Counter = Counter()
+        issue_list: List[SecurityIssue] = []
 
-        # Categorize by type
-        by_category = {}
         for issue in issues:
-            if issue.category not in by_category:
-                by_category[issue.category] = []
-            by_category[issue.category].append(issue)
+            severity_counts[issue.severity] += 1
+            category_counts[issue.category] += 1
+            issue_list.append(issue)
 
+        # Built after consuming issues: SOC2 statuses are set as the audit runs
         report = {
             "timestamp": datetime.now().isoformat(),
             "summary": {
-                "total_issues": len(issues),
-                "critical": len(by_severity["critical"]),
-                "high": len(by_severity["high"]),
-                "medium": len(by_severity["medium"]),
-                "low": len(by_severity["low"]),
-                "info": len(by_severity["info"])
-            },
-            "by_category": {
-                cat: len(issues_list) for cat, issues_list in by_category.items()
+                "total_issues": len(issue_list),
+                **{severity: severity_counts[severity] for severity in _SEVERITY_LEVELS}
             },
-            "soc2_compliance": {
+            "by_category": dict(category_counts),
+            "soc2_compliance": self._soc2_compliance_section(),
+            "issues": issue_list
+        }
+
+        return report
+
+    def _soc2_compliance_section(self) -> Dict[str, Dict[str, Any]]:
+        """SOC2 status per control, shared between reports while no control changes"""
+        if self._soc2_rendered is None or self._soc2_rendered[0] != self._soc2_version:
+            self._soc2_rendered = (self._soc2_version, {
                 control_id: {
                     "status": control.compliance_status,
                     "findings": control.findings
                 }
                 for control_id, control in self.soc2_controls.items()
-            },
-            "issues": [
-                {
-                    "severity": issue.severity,
-                    "category": issue.category,
-                    "title": issue.title,
-                    "description": issue.description,
-                    "file": issue.file_path,
-                    "line": issue.line_number,
-                    "remediation": issue.remediation,
-                    "cwe_id": issue.cwe_id,
-                    "cve_id": issue.cve_id
-                }
-                for issue in issues
-            ]
-        }
+            })
 
-        return report
+        return self._soc2_rendered[1]
+
+    def save_report(
+        self,
+        report: Dict[str, Any],
+        filename: str = "security_audit.json",
+        pretty: bool = False,
+        formats: Sequence[str] = _REPORT_FORMATS
+    ) -> Path:
+        """
+        Save audit report to file
+
+        The JSON copy is written compact for tooling; pass pretty=True for
+        indented output. The markdown copy is the human-readable report.
+        JSON-only callers pass formats=("json",) to skip markdown rendering.
+
+        Returns:
+            Path of the JSON report, or of the markdown report if JSON was not requested
+        """
+        unknown = set(formats) - set(_REPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported report formats: {sorted(unknown)}")
 
-    def save_report(self, report: Dict[str, Any], filename: str = "security_audit.json") -> Path:
-        """Save audit report to file"""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         report_path = self.output_dir / filename
 
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
-
-        self.logger.info(f"Security audit report saved to {report_path}")
+        if "json" in formats:
+            write_json(report_path, report, pretty=pretty, default=_issue_json)
+            self.logger.info(f"Security audit report saved to {report_path}")
 
-        # Also save human-readable markdown
-        md_path = self.output_dir / filename.replace('.json', '.md')
-        self._save_markdown_report(report, md_path)
+        # Human-readable markdown alongside the JSON
+        if "md" in formats:
+            md_path = self.output_dir / filename.replace('.json', '.md')
+            self._save_markdown_report(report, report['issues'], md_path)
+            if "json" not in formats:
+                return md_path
 
         return report_path
 
-    def _save_markdown_report(self, report: Dict[str, Any], path: Path):
-        """Save human-readable markdown report"""
-
-        md_content = f"""# Security Audit Report
+    def _save_markdown_report(self, report: Dict[str, Any], issues: List[SecurityIssue], path: Path):
+        """Stream human-readable markdown report through a buffered file handle"""
+        with open(path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(f"""# Security Audit Report
 
 **Date**: {report['timestamp']}
 
@@ -938,55 +1386,44 @@ class AuditorEnhanced:
 
 ## Issues by Category
 
-"""
-
-        for category, count in report['by_category'].items():
-            md_content += f"- **{category.upper()}**: {count} issues\n"
+""")
 
-        md_content += "\n## SOC2 Compliance Status\n\n"
+            for category, count in report['by_category'].items():
+                f.write(f"- **{category.upper()}**: {count} issues\n")
 
-        for control_id, control_data in report['soc2_compliance'].items():
-            status_emoji = "✅" if control_data['status'] == "compliant" else "❌"
-            md_content += f"### {status_emoji} {control_id}: {control_data['status'].upper()}\n\n"
+            f.write("\n## SOC2 Compliance Status\n\n")
 
-            if control_data['findings']:
-                md_content += "**Findings**:\n"
-                for finding in control_data['findings']:
-                    md_content += f"- {finding}\n"
-                md_content += "\n"
+            for control_id, control_data in report['soc2_compliance'].items():
+                status_emoji = "✅" if control_data['status'] == "compliant" else "❌"
+                f.write(f"### {status_emoji} {control_id}: {control_data['status'].upper()}\n\n")
 
-        md_content += "\n## Detailed Issues\n\n"
+                if control_data['findings']:
+                    f.write("**Findings**:\n")
+                    f.writelines(f"- {finding}\n" for finding in control_data['findings'])
+                    f.write("\n")
 
-        for issue in report['issues']:
-            severity_emoji = {
-                "critical": "🔴",
-                "high": "🟠",
-                "medium": "🟡",
-                "low": "🔵",
-                "info": "⚪"
-            }.get(issue['severity'], "⚪")
+            f.write("\n## Detailed Issues\n\n")
 
-            md_content += f"### {severity_emoji} {issue['title']}\n\n"
-            md_content += f"**Severity**: {issue['severity'].upper()}\n"
-            md_content += f"**Category**: {issue['category']}\n"
+            for issue in issues:
+                severity_emoji = _SEVERITY_EMOJI.get(issue.severity, "⚪")
 
-            if issue.get('file'):
-                md_content += f"**File**: `{issue['file']}`"
-                if issue.get('line'):
-                    md_content += f" (line {issue['line']})"
-                md_content += "\n"
+                f.write(_ISSUE_HEAD_TMPL.format(
+                    emoji=severity_emoji, title=issue.title, severity=issue.severity.upper(), category=issue.category
+                ))
 
-            md_content += f"\n**Description**: {issue['description']}\n\n"
-            md_content += f"**Remediation**: {issue['remediation']}\n\n"
+                if issue.file_path:
+                    f.write(f"**File**: `{issue.file_path}`")
+                    if issue.line_number:
+                        f.write(f" (line {issue.line_number})")
+                    f.write("\n")
 
-            if issue.get('cwe_id'):
-                md_content += f"**CWE**: {issue['cwe_id']}\n"
-            if issue.get('cve_id'):
-                md_content += f"**CVE**: {issue['cve_id']}\n"
+                f.write(_ISSUE_BODY_TMPL.format(description=issue.description, remediation=issue.remediation))
 
-            md_content += "\n---\n\n"
+                if issue.cwe_id:
+                    f.write(f"**CWE**: {issue.cwe_id}\n")
+                if issue.cve_id:
+                    f.write(f"**CVE**: {issue.cve_id}\n")
 
-        with open(path, 'w') as f:
-            f.write(md_content)
+                f.write("\n---\n\n")
 
         self.logger.info(f"Markdown report saved to {path}")
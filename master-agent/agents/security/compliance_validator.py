@@ -10,18 +10,133 @@ Expert in SOC2 Trust Services Criteria compliance validation:
 Automated compliance checks with evidence collection
 """
 
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import Counter
+from contextlib import contextmanager
+import functools
+import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 import json
+import os
 import re
 import logging
 
+from .scan_utils import LiteralPrescreen, PatternSet, loads_json, open_for_scan, walk_files, write_json
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Evidence patterns per _check_* helper: (regex, literal triggers), where every
+# match contains at least one trigger (compared case-insensitively). Patterns are
+# case-insensitive unless their _EvidenceCheck sets flags=0
+
+# CC6.1 access control
+_AUTH_PATTERNS = (
+    (r"(authenticate|auth|login|signin)", (b"auth", b"login", b"signin")),
+    (r"passport\.(authenticate|use)", (b"passport.",)),
+    (r"jwt\.(sign|verify)", (b"jwt.",)),
+    (r"@RequiresAuth", (b"@requiresauth",)),
+    (r"@authenticated", (b"@authenticated",))
+)
+_AUTHZ_PATTERNS = (
+    (r"(authorize|permission|role|rbac|acl)", (b"authorize", b"permission", b"role", b"rbac", b"acl")),
+    (r"@RequiresRole", (b"@requiresrole",)),
+    (r"@RequiresPermission", (b"@requirespermission",)),
+    (r"canAccess|hasPermission|checkRole", (b"canaccess", b"haspermission", b"checkrole"))
+)
+_MFA_PATTERNS = (
+    (r"(mfa|2fa|two.factor|multi.factor|totp|otp)", (b"mfa", b"2fa", b"factor", b"otp")),
+    (r"authenticator|yubikey", (b"authenticator", b"yubikey")),
+    (r"speakeasy|otplib", (b"speakeasy", b"otplib"))
+)
+_PASSWORD_PATTERNS = (
+    (r"password.?policy", (b"policy",)),
+    (r"password.?strength|password.?complexity", (b"strength", b"complexity")),
+    (r"bcrypt|argon2|scrypt", (b"bcrypt", b"argon2", b"scrypt")),
+    (r"min.?length|password.?length", (b"length",))
+)
+
+# CC6.6 encryption; weak algorithm hits count against the control
+_ENCRYPTION_PATTERNS = (
+    (r"encrypt|cipher|aes|rsa", (b"encrypt", b"cipher", b"aes", b"rsa")),
+    (r"Fernet|cryptography", (b"fernet", b"cryptography")),
+    (r"database.?encrypt", (b"encrypt",))
+)
+_KEY_MGMT_PATTERNS = (
+    (r"key.?management|kms", (b"management", b"kms")),
+    (r"vault|secrets.?manager", (b"vault", b"manager")),
+    (r"AWS.?KMS|Google.?KMS|Azure.?KeyVault", (b"kms", b"keyvault"))
+)
+_STRONG_ALGO_PATTERNS = (
+    (r"AES-?256", (b"aes",)),
+    (r"RSA-?2048", (b"2048",)),
+    (r"RSA-?4096", (b"4096",)),
+    (r"argon2", (b"argon2",)),
+    (r"scrypt", (b"scrypt",))
+)
+_WEAK_ALGO_PATTERNS = (
+    (r"DES", (b"des",)),
+    (r"MD5", (b"md5",)),
+    (r"SHA-?1[^0-9]", (b"sha",)),
+    (r"RC4", (b"rc4",))
+)
+
+# CC6.7 transmission; weak TLS and disabled verification count against it
+_TLS_PATTERNS = (
+    (r"https://", (b"https://",)),
+    (r"tls|ssl", (b"tls", b"ssl")),
+    (r"wss://", (b"wss://",)),
+    (r"CERT_REQUIRED", (b"cert_required",))
+)
+_STRONG_TLS_PATTERNS = (
+    (r"TLS.?1\.[23]", (b"tls",)),
+    (r"TLSv1_[23]", (b"tlsv1_",))
+)
+_WEAK_TLS_PATTERNS = (
+    (r"TLS.?1\.0", (b"tls",)),
+    (r"TLSv1_0", (b"tlsv1_0",)),
+    (r"SSLv[23]", (b"sslv",))
+)
+_CERT_PATTERNS = (
+    (r"verify.?cert|cert.?verify", (b"verify",)),
+    (r"CERT_REQUIRED", (b"cert_required",)),
+    (r"ssl_verify|verify_ssl", (b"ssl_verify", b"verify_ssl"))
+)
+_INSECURE_CERT_PATTERNS = (
+    (r"verify.?=.?False", (b"false",)),
+    (r"ssl_verify.?=.?False", (b"ssl_verify",)),
+    (r"CERT_NONE", (b"cert_none",))
+)
+
+# CC7.2 monitoring
+_LOGGING_PATTERNS = (
+    (r"import logging", (b"import logging",)),
+    (r"logger\.|log\.", (b"logger.", b"log.")),
+    (r"winston|pino|bunyan", (b"winston", b"pino", b"bunyan")),
+    (r"console\.(log|info|warn|error)", (b"console.",))
+)
+_MONITORING_PATTERNS = (
+    (r"monitor|alert|sentry|datadog", (b"monitor", b"alert", b"sentry", b"datadog")),
+    (r"security.?event|audit.?log", (b"event", b"audit")),
+    (r"prometheus|grafana", (b"prometheus", b"grafana"))
+)
+_AUDIT_PATTERNS = (
+    (r"audit.?log|audit.?trail", (b"audit",)),
+    (r"access.?log", (b"access",)),
+    (r"user.?activity", (b"activity",))
+)
+_ALERT_PATTERNS = (
+    (r"alert|notify|notification", (b"alert", b"notify", b"notification")),
+    (r"email.?alert|sms.?alert", (b"alert",)),
+    (r"pagerduty|opsgenie|victorops", (b"pagerduty", b"opsgenie", b"victorops"))
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ComplianceEvidence:
     """Evidence for compliance validation"""
 
@@ -34,7 +149,7 @@ class ComplianceEvidence:
     details: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceResult:
     """Compliance validation result"""
 
@@ -48,6 +163,133 @@ class ComplianceResult:
     validation_timestamp: str
 
 
+@dataclass
+class _SourceMatches:
+    """Pattern matches of one source scan as parallel columns, one entry per file in scan order"""
+
+    paths: List[str] = field(default_factory=list)  # Relative to the project root
+    masks: List[int] = field(default_factory=list)  # Bit i set when pattern id i matched
+
+
+@dataclass(frozen=True)
+class _EvidenceCheck:
+    """Patterns a _check_* helper looks for and the source files it reads"""
+
+    patterns: Tuple[Tuple[str, Tuple[bytes, ...]], ...]
+    suffixes: Tuple[str, ...] = (".py", ".js")
+    flags: int = re.IGNORECASE
+
+
+# Evidence checks by name; every pattern is matched in one pass per source file
+_EVIDENCE_CHECKS: Dict[str, _EvidenceCheck] = {
+    "authentication": _EvidenceCheck(_AUTH_PATTERNS, suffixes=(".py", ".js", ".ts")),
+    "authorization": _EvidenceCheck(_AUTHZ_PATTERNS),
+    "mfa": _EvidenceCheck(_MFA_PATTERNS),
+    "password_policies": _EvidenceCheck(_PASSWORD_PATTERNS),
+    "encryption_at_rest": _EvidenceCheck(_ENCRYPTION_PATTERNS),
+    "key_management": _EvidenceCheck(_KEY_MGMT_PATTERNS),
+    "weak_algorithms": _EvidenceCheck(_WEAK_ALGO_PATTERNS),
+    "strong_algorithms": _EvidenceCheck(_STRONG_ALGO_PATTERNS),
+    "tls_usage": _EvidenceCheck(_TLS_PATTERNS),
+    "weak_tls": _EvidenceCheck(_WEAK_TLS_PATTERNS),
+    "strong_tls": _EvidenceCheck(_STRONG_TLS_PATTERNS),
+    "insecure_certificates": _EvidenceCheck(_INSECURE_CERT_PATTERNS),
+    "certificate_validation": _EvidenceCheck(_CERT_PATTERNS),
+    "logging": _EvidenceCheck(_LOGGING_PATTERNS, flags=0),  # Case-sensitive
+    "security_monitoring": _EvidenceCheck(_MONITORING_PATTERNS),
+    "audit_trails": _EvidenceCheck(_AUDIT_PATTERNS),
+    "alerting": _EvidenceCheck(_ALERT_PATTERNS),
+}
+
+# Source files scanned, in scan order
+_SOURCE_SUFFIXES = (".py", ".js", ".ts")
+
+
+def _check_pattern_ids(checks: Dict[str, _EvidenceCheck]) -> Dict[str, range]:
+    """Give each check a contiguous range of ids in the flattened pattern list"""
+    ids = {}
+    start = 0
+    for name, check in checks.items():
+        ids[name] = range(start, start + len(check.patterns))
+        start += len(check.patterns)
+    return ids
+
+
+_CHECK_PATTERN_IDS = _check_pattern_ids(_EVIDENCE_CHECKS)
+
+# Check name -> bitmask of its pattern ids, tested against per-file match masks
+_CHECK_MASKS = {name: sum(1 << index for index in ids) for name, ids in _CHECK_PATTERN_IDS.items()}
+_PATTERN_SOURCES = tuple(pattern for check in _EVIDENCE_CHECKS.values() for pattern, _ in check.patterns)
+_PATTERN_SET = PatternSet([
+    (pattern.encode(), check.flags) for check in _EVIDENCE_CHECKS.values() for pattern, _ in check.patterns
+])
+
+# Pattern id -> triggers; files with no trigger of a pattern skip its regex
+_PATTERN_PRESCREEN = LiteralPrescreen(
+    dict(enumerate(triggers for check in _EVIDENCE_CHECKS.values() for _, triggers in check.patterns)),
+    ignore_case=True
+)
+
+# Bump whenever the cache layout changes; pattern edits are caught by _RULESET_DIGEST
+_SCAN_CACHE_VERSION = 1
+
+# Identifies the evidence ruleset that cached pattern ids refer to
+_RULESET_DIGEST = hashlib.blake2b(
+    json.dumps([[name, [pattern for pattern, _ in check.patterns], list(check.suffixes), check.flags]
+                for name, check in _EVIDENCE_CHECKS.items()]).encode(),
+    digest_size=16
+).hexdigest()
+
+# Source suffix -> ids of the patterns whose checks read that kind of file
+_SUFFIX_PATTERN_IDS = {
+    suffix: tuple(
+        index
+        for name, check in _EVIDENCE_CHECKS.items() if suffix in check.suffixes
+        for index in _CHECK_PATTERN_IDS[name]
+    )
+    for suffix in _SOURCE_SUFFIXES
+}
+
+
+# Uncached files needed before matching moves to a process pool
+_PARALLEL_SCAN_MIN_FILES = 256
+
+
+def _ids_mask(ids: Iterable[int]) -> int:
+    """Bitmask with bit i set for each pattern id i"""
+    mask = 0
+    for index in ids:
+        mask |= 1 << index
+    return mask
+
+
+def _mask_ids(mask: int) -> List[int]:
+    """Pattern ids set in a bitmask, ascending"""
+    return [index for index in range(mask.bit_length()) if mask >> index & 1]
+
+
+def _match_source(suffix: str, file_path: Path) -> Optional[int]:
+    """Bitmask of the evidence patterns matching a source file, None if unreadable (process pool worker)"""
+    try:
+        with open_for_scan(file_path) as content:
+            candidates = _PATTERN_PRESCREEN.hits(content).intersection(_SUFFIX_PATTERN_IDS[suffix])
+            if not candidates:
+                return 0
+
+            return _ids_mask(_PATTERN_SET.matching(content, candidates))
+    except (OSError, ValueError):
+        return None
+
+
+def _shares_source_scan(method):
+    """Run a validate_* method with one source scan shared by all of its checks"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._shared_scan():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class ComplianceValidator:
     """
     SOC2 compliance automation and validation
@@ -72,6 +314,20 @@ class ComplianceValidator:
         # Initialize compliance controls
         self.controls = self._initialize_controls()
 
+        # Source scan shared by the checks of one validation run (see _shared_scan)
+        self._scan_shared = False
+        self._scan_table: Optional[_SourceMatches] = None
+
+        # (content key, match mask) keyed by (path, mtime_ns, size), so repeat validations
+        # skip reading unchanged files; rebuilt each scan so removed files drop out
+        self._match_stat_cache: Dict[Tuple[str, int, int], Tuple[str, int]] = {}
+
+        # Matched pattern ids keyed by source suffix and content hash, persisted across
+        # runs so unchanged files are not rescanned (loaded lazily)
+        self._scan_cache_path = self.output_dir / "scan_cache.json"
+        self._scan_cache: Optional[Dict[str, List[int]]] = None
+
+    @_shares_source_scan
     def validate_all_controls(self) -> Dict[str, ComplianceResult]:
         """
         Validate all SOC2 controls
@@ -83,26 +339,23 @@ class ComplianceValidator:
 
         results = {}
 
-        for control_id in ["CC6.1", "CC6.6", "CC6.7", "CC7.2"]:
-            self.logger.info(f"Validating {control_id}")
-
-            if control_id == "CC6.1":
-                result = self.validate_cc61_access_control()
-            elif control_id == "CC6.6":
-                result = self.validate_cc66_encryption()
-            elif control_id == "CC6.7":
-                result = self.validate_cc67_transmission()
-            elif control_id == "CC7.2":
-                result = self.validate_cc72_monitoring()
-            else:
-                continue
+        validators = {
+            "CC6.1": self.validate_cc61_access_control,
+            "CC6.6": self.validate_cc66_encryption,
+            "CC6.7": self.validate_cc67_transmission,
+            "CC7.2": self.validate_cc72_monitoring
+        }
 
-            results[control_id] = result
+        # The source scan runs once, on the first check; later controls only read its matches
+        for control_id, validate in validators.items():
+            self.logger.info(f"Validating {control_id}")
+            results[control_id] = validate()
 
         self.logger.info("SOC2 validation complete")
 
         return results
 
+    @_shares_source_scan
     def validate_cc61_access_control(self) -> ComplianceResult:
         """
         Validate CC6.1: Logical and Physical Access Controls
@@ -170,6 +423,7 @@ class ComplianceValidator:
             validation_timestamp=datetime.now().isoformat()
         )
 
+    @_shares_source_scan
     def validate_cc66_encryption(self) -> ComplianceResult:
         """
         Validate CC6.6: Encryption of Confidential Information
@@ -228,6 +482,7 @@ class ComplianceValidator:
             validation_timestamp=datetime.now().isoformat()
         )
 
+    @_shares_source_scan
     def validate_cc67_transmission(self) -> ComplianceResult:
         """
         Validate CC6.7: Transmission of Confidential Information
@@ -283,6 +538,7 @@ class ComplianceValidator:
             validation_timestamp=datetime.now().isoformat()
         )
 
+    @_shares_source_scan
     def validate_cc72_monitoring(self) -> ComplianceResult:
         """
         Validate CC7.2: System Monitoring and Detection
@@ -365,15 +621,13 @@ class ComplianceValidator:
         for result in results.values():
             status_counts[result.status] = status_counts.get(result.status, 0) + 1
 
-        # Collect all gaps
-        all_gaps = []
-        for result in results.values():
-            all_gaps.extend(result.gaps)
+        # Collect all gaps, each once, in control order
+        all_gaps = list(dict.fromkeys(gap for result in results.values() for gap in result.gaps))
 
-        # Collect all recommendations
-        all_recommendations = []
-        for result in results.values():
-            all_recommendations.extend(result.recommendations)
+        # Rank recommendations by how many controls make them, first seen first on ties
+        recommendation_counts = Counter(
+            recommendation for result in results.values() for recommendation in result.recommendations
+        )
 
         report = {
             "timestamp": datetime.now().isoformat(),
@@ -397,19 +651,20 @@ class ComplianceValidator:
                 for control_id, result in results.items()
             },
             "critical_gaps": all_gaps,
-            "priority_recommendations": all_recommendations[:10]  # Top 10
+            "priority_recommendations": [
+                recommendation for recommendation, _ in recommendation_counts.most_common(10)
+            ]
         }
 
         return report
 
     def save_compliance_report(self, report: Dict[str, Any], filename: str = "soc2_compliance.json") -> Path:
-        """Save compliance report to file"""
+        """Save compliance report to file (indented JSON, via orjson when installed)"""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         report_path = self.output_dir / filename
 
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_json(report_path, report, pretty=True)
 
         self.logger.info(f"Compliance report saved to {report_path}")
 
@@ -419,44 +674,190 @@ class ComplianceValidator:
 
         return report_path
 
-    # Helper methods for CC6.1 validation
-    def _check_authentication(self) -> List[ComplianceEvidence]:
-        """Check for authentication mechanisms"""
-        evidence = []
+    # Shared source scan
+    @contextmanager
+    def _shared_scan(self):
+        """Reuse one scan of the project sources for every check run inside the block"""
+        outer = self._scan_shared
+        self._scan_shared = True
+        try:
+            yield
+        finally:
+            if not outer:
+                self._scan_shared = False
+                self._scan_table = None
+
+    def _source_matches(self) -> _SourceMatches:
+        """Match table of the project sources, shared within a _shared_scan block"""
+        if self._scan_table is not None:
+            return self._scan_table
+
+        table = self._scan_sources()
+        if self._scan_shared:
+            self._scan_table = table
+
+        return table
+
+    def _scan_sources(self) -> _SourceMatches:
+        """Read each source file once and match every evidence pattern that applies to it"""
+        disk_cache = self._load_scan_cache()
+        files = []    # (relative path, stat key, content key) in scan order
+        matches = []  # Match mask per file; None until pending files are matched
+        pending = []  # (index, suffix, path) of files neither cache knows
+
+        # Walked paths start with the root as given, so relative paths are a slice
+        root_prefix = os.path.join(str(self.project_root), "")
+
+        for suffix, file_path in self._source_files():
+            path_str = str(file_path)
+            try:
+                st = file_path.stat()
+                stat_key = (path_str, st.st_mtime_ns, st.st_size)
+                hit = self._match_stat_cache.get(stat_key)
+                if hit is None:
+                    with open_for_scan(file_path) as content:
+                        content_key = f"{suffix}:{hashlib.blake2b(content, digest_size=16).hexdigest()}"
+            except (OSError, ValueError) as e:
+                # Unreadable, or truncated while being mapped
+                self.logger.debug(f"Skipping {file_path}: {e}")
+                continue
+
+            if hit is None:
+                cached = disk_cache.get(content_key)
+                if cached is None:
+                    pending.append((len(files), suffix, file_path))
+                hit = (content_key, None if cached is None else _ids_mask(cached))
+
+            if path_str.startswith(root_prefix):
+                rel_path = path_str[len(root_prefix):]
+            else:
+                rel_path = str(file_path.relative_to(self.project_root))
+
+            content_key, matched = hit
+            files.append((rel_path, stat_key, content_key))
+            matches.append(matched)
 
-        # Common authentication patterns
-        auth_patterns = [
-            r"(?i)(authenticate|auth|login|signin)",
-            r"(?i)passport\.(authenticate|use)",
-            r"(?i)jwt\.(sign|verify)",
-            r"@RequiresAuth",
-            r"@authenticated"
-        ]
+        for (index, _, _), matched in zip(pending, self._match_pending(pending)):
+            if matched is not None:
+                matches[index] = matched
 
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js")) + list(self.project_root.rglob("*.ts"))
+        table = _SourceMatches()
+        stat_cache = {}
+        entries = {}
 
-        for file_path in files:
-            if "node_modules" in str(file_path):
+        for (rel_path, stat_key, content_key), matched in zip(files, matches):
+            # Still None: the file became unreadable before it was matched
+            if matched is None:
                 continue
 
+            stat_cache[stat_key] = (content_key, matched)
+            entries[content_key] = _mask_ids(matched)
+            table.paths.append(rel_path)
+            table.masks.append(matched)
+
+        self._match_stat_cache = stat_cache
+
+        # Only this tree's current files are kept, so edits do not grow the cache
+        if entries != disk_cache:
+            self._save_scan_cache(entries)
+
+        return table
+
+    def _match_pending(self, pending: List[Tuple[int, str, Path]]) -> List[Optional[int]]:
+        """Match uncached files, across a process pool when there are enough of them"""
+        suffixes = [suffix for _, suffix, _ in pending]
+        paths = [file_path for _, _, file_path in pending]
+
+        if len(pending) >= _PARALLEL_SCAN_MIN_FILES:
             try:
-                content = file_path.read_text()
-
-                for pattern in auth_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.1",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Authentication mechanism detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence  # Found authentication
-
-            except Exception:
-                pass
+                with ProcessPoolExecutor() as executor:
+                    return list(executor.map(_match_source, suffixes, paths, chunksize=32))
+            except (OSError, BrokenProcessPool) as e:
+                self.logger.debug(f"Process pool unavailable, matching serially: {e}")
+
+        return list(map(_match_source, suffixes, paths))
+
+    def _load_scan_cache(self) -> Dict[str, List[int]]:
+        """Load the on-disk scan cache, discarding it if stale or corrupt"""
+        if self._scan_cache is not None:
+            return self._scan_cache
+
+        self._scan_cache = {}
+        try:
+            cached = loads_json(self._scan_cache_path.read_bytes())
+            if cached.get("version") == _SCAN_CACHE_VERSION and cached.get("ruleset") == _RULESET_DIGEST:
+                self._scan_cache = cached.get("entries", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable scan cache {self._scan_cache_path}: {e}")
+
+        return self._scan_cache
+
+    def _save_scan_cache(self, entries: Dict[str, List[int]]):
+        """Replace the on-disk scan cache atomically"""
+        self._scan_cache = entries
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._scan_cache_path.with_suffix(".tmp")
+            write_json(tmp_path, {
+                "version": _SCAN_CACHE_VERSION,
+                "ruleset": _RULESET_DIGEST,
+                "entries": entries
+            })
+            tmp_path.replace(self._scan_cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save scan cache: {e}")
+
+    def _source_files(self) -> List[Tuple[str, Path]]:
+        """(suffix, path) for Python, JavaScript and TypeScript sources, grouped by suffix in walk order"""
+        buckets: Dict[str, List[Path]] = {suffix: [] for suffix in _SOURCE_SUFFIXES}
+
+        # One walk for every suffix; node_modules, .git and other SKIP_DIRS are pruned unlisted
+        for file_path in walk_files(self.project_root, suffixes=_SOURCE_SUFFIXES):
+            name = file_path.name
+            for suffix, bucket in buckets.items():
+                if name.endswith(suffix):
+                    bucket.append(file_path)
+                    break
+
+        return [(suffix, file_path) for suffix, paths in buckets.items() for file_path in paths]
+
+    def _file_matches(self, *checks: str) -> Iterator[Tuple[str, str, str]]:
+        """(file, check, pattern) for each pattern of the checks matching a source file, file by file"""
+        table = self._source_matches()
+        check_masks = [(check, _CHECK_MASKS[check]) for check in checks]
+
+        # Masks only hold ids of patterns whose checks read the file's suffix
+        for rel_path, mask in zip(table.paths, table.masks):
+            for check, check_mask in check_masks:
+                hits = mask & check_mask
+                if not hits:
+                    continue
+                for index in _CHECK_PATTERN_IDS[check]:
+                    if hits >> index & 1:
+                        yield rel_path, check, _PATTERN_SOURCES[index]
+
+    def _first_match_evidence(self, check: str, control_id: str, description: str) -> List[ComplianceEvidence]:
+        """Evidence from the first source file matching any of a check's patterns"""
+        for rel_path, _, pattern in self._file_matches(check):
+            return [ComplianceEvidence(
+                control_id=control_id,
+                evidence_type="code",
+                file_path=rel_path,
+                line_number=None,
+                description=description,
+                meets_requirement=True,
+                details=f"Pattern: {pattern}"
+            )]
+
+        return []
+
+    # Helper methods for CC6.1 validation
+    def _check_authentication(self) -> List[ComplianceEvidence]:
+        """Check for authentication mechanisms"""
+        evidence = self._first_match_evidence("authentication", "CC6.1", "Authentication mechanism detected")
 
         if not evidence:
             evidence.append(ComplianceEvidence(
@@ -473,39 +874,7 @@ class ComplianceValidator:
 
     def _check_authorization(self) -> List[ComplianceEvidence]:
         """Check for authorization controls"""
-        evidence = []
-
-        authz_patterns = [
-            r"(?i)(authorize|permission|role|rbac|acl)",
-            r"@RequiresRole",
-            r"@RequiresPermission",
-            r"canAccess|hasPermission|checkRole"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in authz_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.1",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Authorization controls detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
+        evidence = self._first_match_evidence("authorization", "CC6.1", "Authorization controls detected")
 
         if not evidence:
             evidence.append(ComplianceEvidence(
@@ -522,38 +891,7 @@ class ComplianceValidator:
 
     def _check_mfa(self) -> List[ComplianceEvidence]:
         """Check for multi-factor authentication"""
-        evidence = []
-
-        mfa_patterns = [
-            r"(?i)(mfa|2fa|two.factor|multi.factor|totp|otp)",
-            r"(?i)authenticator|yubikey",
-            r"speakeasy|otplib"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in mfa_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.1",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Multi-factor authentication detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
+        evidence = self._first_match_evidence("mfa", "CC6.1", "Multi-factor authentication detected")
 
         if not evidence:
             evidence.append(ComplianceEvidence(
@@ -570,77 +908,12 @@ class ComplianceValidator:
 
     def _check_password_policies(self) -> List[ComplianceEvidence]:
         """Check for password policy enforcement"""
-        evidence = []
-
-        password_patterns = [
-            r"(?i)password.?policy",
-            r"(?i)password.?strength|password.?complexity",
-            r"bcrypt|argon2|scrypt",
-            r"(?i)min.?length|password.?length"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in password_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.1",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Password policies detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
-
-        return evidence
+        return self._first_match_evidence("password_policies", "CC6.1", "Password policies detected")
 
     # Helper methods for CC6.6 validation
     def _check_encryption_at_rest(self) -> List[ComplianceEvidence]:
         """Check for encryption at rest"""
-        evidence = []
-
-        encryption_patterns = [
-            r"(?i)encrypt|cipher|aes|rsa",
-            r"Fernet|cryptography",
-            r"(?i)database.?encrypt"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in encryption_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.6",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Encryption at rest detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
+        evidence = self._first_match_evidence("encryption_at_rest", "CC6.6", "Encryption at rest detected")
 
         if not evidence:
             evidence.append(ComplianceEvidence(
@@ -657,124 +930,41 @@ class ComplianceValidator:
 
     def _check_key_management(self) -> List[ComplianceEvidence]:
         """Check for encryption key management"""
-        evidence = []
-
-        key_mgmt_patterns = [
-            r"(?i)key.?management|kms",
-            r"(?i)vault|secrets.?manager",
-            r"AWS.?KMS|Google.?KMS|Azure.?KeyVault"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in key_mgmt_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.6",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Key management system detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
-
-        return evidence
+        return self._first_match_evidence("key_management", "CC6.6", "Key management system detected")
 
     def _check_encryption_algorithms(self) -> List[ComplianceEvidence]:
         """Check for strong encryption algorithms"""
         evidence = []
 
-        strong_algos = [r"AES-?256", r"RSA-?2048", r"RSA-?4096", r"argon2", r"scrypt"]
-        weak_algos = [r"DES", r"MD5", r"SHA-?1[^0-9]", r"RC4"]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                # Check for weak algorithms
-                for pattern in weak_algos:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.6",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description=f"Weak encryption algorithm detected: {pattern}",
-                            meets_requirement=False,
-                            details="Weak algorithms should be replaced"
-                        ))
-
-                # Check for strong algorithms
-                for pattern in strong_algos:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.6",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description=f"Strong encryption algorithm detected: {pattern}",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-
-            except Exception:
-                pass
+        # Per file: weak algorithms first, then strong ones
+        for rel_path, check, pattern in self._file_matches("weak_algorithms", "strong_algorithms"):
+            if check == "weak_algorithms":
+                evidence.append(ComplianceEvidence(
+                    control_id="CC6.6",
+                    evidence_type="code",
+                    file_path=rel_path,
+                    line_number=None,
+                    description=f"Weak encryption algorithm detected: {pattern}",
+                    meets_requirement=False,
+                    details="Weak algorithms should be replaced"
+                ))
+            else:
+                evidence.append(ComplianceEvidence(
+                    control_id="CC6.6",
+                    evidence_type="code",
+                    file_path=rel_path,
+                    line_number=None,
+                    description=f"Strong encryption algorithm detected: {pattern}",
+                    meets_requirement=True,
+                    details=f"Pattern: {pattern}"
+                ))
 
         return evidence
 
     # Helper methods for CC6.7 validation
     def _check_tls_usage(self) -> List[ComplianceEvidence]:
         """Check for TLS/HTTPS usage"""
-        evidence = []
-
-        tls_patterns = [
-            r"https://",
-            r"(?i)tls|ssl",
-            r"wss://",
-            r"CERT_REQUIRED"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in tls_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.7",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="TLS/HTTPS usage detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
+        evidence = self._first_match_evidence("tls_usage", "CC6.7", "TLS/HTTPS usage detected")
 
         if not evidence:
             evidence.append(ComplianceEvidence(
@@ -793,46 +983,28 @@ class ComplianceValidator:
         """Check TLS protocol versions"""
         evidence = []
 
-        strong_tls = [r"TLS.?1\.[23]", r"TLSv1_[23]"]
-        weak_tls = [r"TLS.?1\.0", r"TLSv1_0", r"SSLv[23]"]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                # Check for weak TLS
-                for pattern in weak_tls:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.7",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description=f"Weak TLS version detected: {pattern}",
-                            meets_requirement=False,
-                            details="Upgrade to TLS 1.2 or higher"
-                        ))
-
-                # Check for strong TLS
-                for pattern in strong_tls:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.7",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description=f"Strong TLS version detected: {pattern}",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-
-            except Exception:
-                pass
+        # Per file: weak versions first, then strong ones
+        for rel_path, check, pattern in self._file_matches("weak_tls", "strong_tls"):
+            if check == "weak_tls":
+                evidence.append(ComplianceEvidence(
+                    control_id="CC6.7",
+                    evidence_type="code",
+                    file_path=rel_path,
+                    line_number=None,
+                    description=f"Weak TLS version detected: {pattern}",
+                    meets_requirement=False,
+                    details="Upgrade to TLS 1.2 or higher"
+                ))
+            else:
+                evidence.append(ComplianceEvidence(
+                    control_id="CC6.7",
+                    evidence_type="code",
+                    file_path=rel_path,
+                    line_number=None,
+                    description=f"Strong TLS version detected: {pattern}",
+                    meets_requirement=True,
+                    details=f"Pattern: {pattern}"
+                ))
 
         return evidence
 
@@ -840,55 +1012,34 @@ class ComplianceValidator:
         """Check for certificate validation"""
         evidence = []
 
-        cert_patterns = [
-            r"(?i)verify.?cert|cert.?verify",
-            r"CERT_REQUIRED",
-            r"ssl_verify|verify_ssl"
-        ]
-
-        insecure_patterns = [
-            r"verify.?=.?False",
-            r"ssl_verify.?=.?False",
-            r"CERT_NONE"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                # Check for insecure patterns
-                for pattern in insecure_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.7",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Certificate validation disabled",
-                            meets_requirement=False,
-                            details="Enable certificate validation"
-                        ))
-
-                # Check for secure patterns
-                for pattern in cert_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC6.7",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Certificate validation enabled",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-
-            except Exception:
-                pass
+        # Per file: insecure settings first, then secure ones. Every insecure pattern
+        # yields the same entry, so a file is reported as disabling validation once
+        flagged_file = None
+
+        for rel_path, check, pattern in self._file_matches("insecure_certificates", "certificate_validation"):
+            if check == "insecure_certificates":
+                if rel_path == flagged_file:
+                    continue
+                flagged_file = rel_path
+                evidence.append(ComplianceEvidence(
+                    control_id="CC6.7",
+                    evidence_type="code",
+                    file_path=rel_path,
+                    line_number=None,
+                    description="Certificate validation disabled",
+                    meets_requirement=False,
+                    details="Enable certificate validation"
+                ))
+            else:
+                evidence.append(ComplianceEvidence(
+                    control_id="CC6.7",
+                    evidence_type="code",
+                    file_path=rel_path,
+                    line_number=None,
+                    description="Certificate validation enabled",
+                    meets_requirement=True,
+                    details=f"Pattern: {pattern}"
+                ))
 
         return evidence
 
@@ -897,33 +1048,7 @@ class ComplianceValidator:
         """Check for logging implementation"""
         evidence = []
 
-        logging_patterns = [
-            r"import logging",
-            r"logger\.|log\.",
-            r"winston|pino|bunyan",
-            r"console\.(log|info|warn|error)"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        found_logging = False
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in logging_patterns:
-                    if re.search(pattern, content):
-                        found_logging = True
-                        break
-
-                if found_logging:
-                    break
-
-            except Exception:
-                pass
+        found_logging = next(self._file_matches("logging"), None) is not None
 
         if found_logging:
             evidence.append(ComplianceEvidence(
@@ -950,114 +1075,15 @@ class ComplianceValidator:
 
     def _check_security_monitoring(self) -> List[ComplianceEvidence]:
         """Check for security event monitoring"""
-        evidence = []
-
-        monitoring_patterns = [
-            r"(?i)monitor|alert|sentry|datadog",
-            r"(?i)security.?event|audit.?log",
-            r"prometheus|grafana"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in monitoring_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC7.2",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Security monitoring detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
-
-        return evidence
+        return self._first_match_evidence("security_monitoring", "CC7.2", "Security monitoring detected")
 
     def _check_audit_trails(self) -> List[ComplianceEvidence]:
         """Check for audit trail implementation"""
-        evidence = []
-
-        audit_patterns = [
-            r"(?i)audit.?log|audit.?trail",
-            r"(?i)access.?log",
-            r"(?i)user.?activity"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in audit_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC7.2",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Audit trails detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
-
-        return evidence
+        return self._first_match_evidence("audit_trails", "CC7.2", "Audit trails detected")
 
     def _check_alerting(self) -> List[ComplianceEvidence]:
         """Check for alerting mechanisms"""
-        evidence = []
-
-        alert_patterns = [
-            r"(?i)alert|notify|notification",
-            r"(?i)email.?alert|sms.?alert",
-            r"pagerduty|opsgenie|victorops"
-        ]
-
-        files = list(self.project_root.rglob("*.py")) + list(self.project_root.rglob("*.js"))
-
-        for file_path in files:
-            if "node_modules" in str(file_path):
-                continue
-
-            try:
-                content = file_path.read_text()
-
-                for pattern in alert_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        evidence.append(ComplianceEvidence(
-                            control_id="CC7.2",
-                            evidence_type="code",
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line_number=None,
-                            description="Alerting mechanism detected",
-                            meets_requirement=True,
-                            details=f"Pattern: {pattern}"
-                        ))
-                        return evidence
-
-            except Exception:
-                pass
-
-        return evidence
+        return self._first_match_evidence("alerting", "CC7.2", "Alerting mechanism detected")
 
     # Recommendation generators
     def _generate_cc61_recommendations(self, gaps: List[str]) -> List[str]:
@@ -1178,7 +1204,7 @@ class ComplianceValidator:
             "non_compliant": "❌"
         }
 
-        md_content = f"""# SOC2 Compliance Report
+        parts: List[str] = [f"""# SOC2 Compliance Report
 
 **Date**: {report['timestamp']}
 
@@ -1196,34 +1222,30 @@ class ComplianceValidator:
 
 ## Control Details
 
-"""
+"""]
 
         for control_id, control_data in report['controls'].items():
             emoji = status_emoji.get(control_data['status'], '⚪')
-            md_content += f"### {emoji} {control_id}: {control_data['name']}\n\n"
-            md_content += f"**Status**: {control_data['status'].upper()}\n"
-            md_content += f"**Score**: {control_data['score']}/1.0\n"
-            md_content += f"**Evidence Count**: {control_data['evidence_count']}\n\n"
+            parts.append(f"### {emoji} {control_id}: {control_data['name']}\n\n")
+            parts.append(f"**Status**: {control_data['status'].upper()}\n")
+            parts.append(f"**Score**: {control_data['score']}/1.0\n")
+            parts.append(f"**Evidence Count**: {control_data['evidence_count']}\n\n")
 
             if control_data['gaps']:
-                md_content += "**Gaps**:\n"
-                for gap in control_data['gaps']:
-                    md_content += f"- {gap}\n"
-                md_content += "\n"
+                parts.append("**Gaps**:\n")
+                parts.extend(f"- {gap}\n" for gap in control_data['gaps'])
+                parts.append("\n")
 
             if control_data['recommendations']:
-                md_content += "**Recommendations**:\n"
-                for rec in control_data['recommendations']:
-                    md_content += f"- {rec}\n"
-                md_content += "\n"
+                parts.append("**Recommendations**:\n")
+                parts.extend(f"- {rec}\n" for rec in control_data['recommendations'])
+                parts.append("\n")
 
-            md_content += "---\n\n"
+            parts.append("---\n\n")
 
-        md_content += "## Priority Recommendations\n\n"
-        for i, rec in enumerate(report['priority_recommendations'], 1):
-            md_content += f"{i}. {rec}\n"
+        parts.append("## Priority Recommendations\n\n")
+        parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(report['priority_recommendations'], 1))
 
-        with open(path, 'w') as f:
-            f.write(md_content)
+        path.write_text("".join(parts))
 
         self.logger.info(f"Markdown compliance report saved to {path}")
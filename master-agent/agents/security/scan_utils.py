@@ -0,0 +1,597 @@
+"""
+Shared Scanning Primitives
+
+Used by the security agents for fast, predictable pattern matching:
+- Regex engine selection (Google RE2 when installed, stdlib ``re`` otherwise)
+- Multi-pattern matching and pattern-set membership (Intel Hyperscan when installed, compiled ``re`` otherwise)
+- Literal trigger prescreens (Aho-Corasick when installed, ``in`` otherwise)
+- Project walking that prunes vendored and build directories
+- Zero-copy file access (``mmap`` for large files)
+- Offset to line-number lookup (NumPy-vectorized when installed)
+- Concurrent file reads for async scans (aiofiles when installed, threads otherwise)
+- Buffered JSON report writing and byte-level JSON parsing (orjson when installed)
+
+All accelerators are optional; every helper degrades to the standard library.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+import asyncio
+import fnmatch
+import json
+import mmap
+import os
+import re
+import stat
+import logging
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Not available on Windows
+
+logger = logging.getLogger(__name__)
+
+Pattern = Union[str, bytes]
+Buffer = Union[bytes, mmap.mmap]
+
+# Directories never descended into when walking a project
+SKIP_DIRS = frozenset({
+    "node_modules", ".git", ".venv", "venv", "__pycache__", "dist", "build", ".next", "target", "coverage"
+})
+
+# Files above this size are memory-mapped instead of read into the heap
+MMAP_THRESHOLD = 64 * 1024
+
+# A NUL byte within this many leading bytes marks a file as binary
+BINARY_SNIFF_BYTES = 4096
+
+# Minified, bundled or lock artifacts that are never worth pattern-scanning
+GENERATED_SUFFIXES = (".min.js", ".bundle.js", ".map", ".lock")
+
+# Read size for streaming scans that can stop at the first match
+CHUNK_SIZE = 64 * 1024
+
+# Buffers that must be copied before scanning are streamed in slices of this
+# size, each repeating the last STREAM_OVERLAP bytes of the previous slice
+STREAM_CHUNK_SIZE = 1 << 20
+STREAM_OVERLAP = 4096
+
+# Buffer size for report writers, so output reaches the OS in large writes
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Upper bound on concurrent async reads, whatever the file descriptor limit
+MAX_CONCURRENT_READS = 256
+
+_NEWLINE_RE = re.compile(b'\n')
+
+# Inline equivalents of the ``re`` flags we use, so RE2 sees the same semantics
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+def _with_inline_flags(pattern: Pattern, flags: int) -> Pattern:
+    """Prefix pattern with inline flags, e.g. ``(?i)``"""
+    letters = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+    if not letters:
+        return pattern
+    prefix = f"(?{letters})"
+    return prefix.encode() + pattern if isinstance(pattern, bytes) else prefix + pattern
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: Pattern, flags: int = 0):
+    """
+    Compile a regex with RE2 (linear time, no backtracking) when available
+
+    Falls back to ``re`` when RE2 is not installed or rejects the pattern
+    (lookaround and backreferences are not supported by RE2).
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(_with_inline_flags(pattern, flags), options)
+        except re2.error:
+            logger.debug(f"RE2 rejected pattern, using re: {pattern!r}")
+    return re.compile(pattern, flags)
+
+
+@contextmanager
+def open_for_scan(path: Path, max_bytes: Optional[int] = None, skip_generated: bool = True) -> Iterator[Buffer]:
+    """
+    Open a file for byte-level regex scanning
+
+    Small files are read into memory; larger ones are memory-mapped so the OS
+    pages them in on demand and nothing is decoded or copied. Both ``re`` and
+    RE2 accept either buffer directly.
+
+    Generated artifacts (unless skip_generated is False), files larger than
+    max_bytes and binary files (a NUL byte in the first 4 KiB) yield an empty
+    buffer instead, so callers scan them as if they had no content.
+    """
+    if skip_generated and path.name.endswith(GENERATED_SUFFIXES):
+        yield b""
+        return
+
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if max_bytes is not None and size > max_bytes:
+            logger.debug(f"Skipping {path}: {size} bytes exceeds {max_bytes}")
+            yield b""
+            return
+
+        if size <= MMAP_THRESHOLD:
+            data = f.read()
+            yield b"" if b"\x00" in data[:BINARY_SNIFF_BYTES] else data
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield b"" if mapped.find(b"\x00", 0, BINARY_SNIFF_BYTES) != -1 else mapped
+
+
+def walk_files(
+    root: Path, skip_dirs: FrozenSet[str] = SKIP_DIRS, suffixes: Optional[Tuple[str, ...]] = None
+) -> Iterator[Path]:
+    """
+    Yield every file under root, depth-first in directory order
+
+    Directories named in skip_dirs are pruned during the walk, so their
+    subtrees are never listed rather than being filtered out afterwards.
+    With suffixes, only file names ending in one of them are yielded, and
+    no Path is built for the rest.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in skip_dirs]
+        directory = Path(dirpath)
+        for name in filenames:
+            if suffixes is None or name.endswith(suffixes):
+                yield directory / name
+
+
+@lru_cache(maxsize=None)
+def glob_matcher(*patterns: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile filename globs (``*.py``, ``requirements*.txt``) into one match function"""
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns)).match
+
+
+def readable_size(path: Path) -> Optional[int]:
+    """
+    Size of a scan candidate, or None if it must not be scanned
+
+    Only regular files (symlinks are not followed) that this process is
+    allowed to read qualify, decided with a single lstat so unreadable or
+    special files never reach the scanners.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode) or not os.access(path, os.R_OK):
+        return None
+    return st.st_size
+
+
+def is_dotenv(name: str) -> bool:
+    """Whether a file name is a dotenv file (.env, .env.local, ...), which has no Path.suffix"""
+    return name == ".env" or name.startswith(".env.")
+
+
+def is_readable_file(path: Path, max_bytes: Optional[int] = None) -> bool:
+    """Admission check for scan candidates: readable regular file within max_bytes"""
+    size = readable_size(path)
+    return size is not None and (max_bytes is None or size <= max_bytes)
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON straight from file bytes, skipping the intermediate str decode
+
+    Raises json.JSONDecodeError (orjson's decode error subclasses it) on
+    malformed or non-UTF-8 input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(
+    path: Path,
+    data: Any,
+    pretty: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+):
+    """
+    Write data to path as UTF-8 JSON, compact unless pretty is set
+
+    orjson serializes the whole document to bytes for a single write when
+    installed; otherwise the stdlib encoder streams into a 64 KiB buffer
+    rather than issuing one small write per token. default converts objects
+    neither encoder handles, dataclasses included, at serialization time.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, default=default, option=option))
+        return
+
+    with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        if pretty:
+            json.dump(data, f, indent=2, default=default)
+        else:
+            json.dump(data, f, separators=(',', ':'), default=default)
+
+
+def iter_chunks(path: Path, chunk_size: int = CHUNK_SIZE, overlap: int = 0) -> Iterator[bytes]:
+    """
+    Yield a file in fixed-size chunks without loading it whole
+
+    Each chunk is prefixed with the last overlap bytes of the previous one,
+    so any match no longer than overlap + 1 bytes is seen intact in at least
+    one chunk even when it straddles a boundary.
+    """
+    with open(path, 'rb') as f:
+        tail = b""
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                return
+            yield tail + block
+            if overlap:
+                tail = (tail + block)[-overlap:]
+
+
+def iter_buffer_chunks(
+    data: Buffer, chunk_size: int = STREAM_CHUNK_SIZE, overlap: int = STREAM_OVERLAP
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield ``(base_offset, chunk)`` slices of a buffer as bytes
+
+    Only the current slice is copied, so a memory-mapped file is never
+    materialized in full. Consecutive slices share overlap bytes, so a match
+    up to overlap + 1 bytes long is whole in at least one of them; adding
+    base_offset to a chunk-relative position gives the offset in data.
+    """
+    size = len(data)
+    if size <= chunk_size:
+        yield 0, data if isinstance(data, bytes) else data[:]
+        return
+
+    step = chunk_size - overlap
+    for base in range(0, size - overlap, step):
+        yield base, data[base:base + chunk_size]
+
+
+def filter_scannable(path: Path, data: bytes, max_bytes: Optional[int] = None) -> bytes:
+    """Apply the open_for_scan skip rules to an already-read buffer"""
+    if path.name.endswith(GENERATED_SUFFIXES):
+        return b""
+    if max_bytes is not None and len(data) > max_bytes:
+        logger.debug(f"Skipping {path}: more than {max_bytes} bytes")
+        return b""
+    return b"" if b"\x00" in data[:BINARY_SNIFF_BYTES] else data
+
+
+def read_concurrency_limit() -> int:
+    """Number of files that may be open at once, half the soft descriptor limit"""
+    if resource is None:
+        return 64
+    soft_limit, _hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft_limit == resource.RLIM_INFINITY:
+        return MAX_CONCURRENT_READS
+    return max(1, min(MAX_CONCURRENT_READS, soft_limit // 2))
+
+
+def _read_head(path: Path, limit: int) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read(limit)
+
+
+async def read_files_async(paths: Iterable[Path], max_bytes: Optional[int] = None) -> Dict[Path, bytes]:
+    """
+    Read files concurrently for scanning
+
+    Reads overlap through aiofiles when installed, or worker threads
+    otherwise, bounded by read_concurrency_limit() so large trees cannot
+    exhaust file descriptors. At most max_bytes + 1 bytes are read per file,
+    enough for filter_scannable to reject oversized files. Unreadable files
+    are logged and left out of the result.
+    """
+    semaphore = asyncio.Semaphore(read_concurrency_limit())
+    limit = -1 if max_bytes is None else max_bytes + 1
+
+    async def read_one(path: Path) -> Tuple[Path, Optional[bytes]]:
+        if path.name.endswith(GENERATED_SUFFIXES):
+            return path, b""
+        async with semaphore:
+            try:
+                if aiofiles is not None:
+                    async with aiofiles.open(path, 'rb') as f:
+                        return path, await f.read(limit)
+                return path, await asyncio.to_thread(_read_head, path, limit)
+            except OSError as e:
+                logger.warning(f"Error reading {path}: {e}")
+                return path, None
+
+    results = await asyncio.gather(*(read_one(path) for path in paths))
+    return {path: data for path, data in results if data is not None}
+
+
+class LineIndex:
+    """
+    Map byte offsets in a buffer to 1-based line numbers
+
+    Newline positions are located once, on first lookup, with a vectorized
+    NumPy compare when available, then each lookup is a binary search. The
+    first lookup must happen while the underlying buffer is still open.
+    """
+
+    __slots__ = ("_data", "_newlines")
+
+    def __init__(self, data: Buffer):
+        self._data = data
+        self._newlines = None
+
+    def line_of(self, offset: int) -> int:
+        """Return the line number containing offset"""
+        if self._newlines is None:
+            self._newlines = self._find_newlines(self._data)
+            self._data = None
+
+        if np is not None:
+            return int(np.searchsorted(self._newlines, offset)) + 1
+        return bisect_left(self._newlines, offset) + 1
+
+    @staticmethod
+    def _find_newlines(data: Buffer):
+        if np is not None:
+            return np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 0x0A)
+        return [match.start() for match in _NEWLINE_RE.finditer(data)]
+
+
+def _hyperscan_database(patterns: Sequence[Tuple[Pattern, int]], mode_flags: int):
+    """Compile patterns into a Hyperscan block-mode database, or None if Hyperscan rejects them"""
+    expressions = [regex if isinstance(regex, bytes) else regex.encode() for regex, _ in patterns]
+    hs_flags = [
+        mode_flags | (hyperscan.HS_FLAG_CASELESS if flags & re.IGNORECASE else 0)
+        for _, flags in patterns
+    ]
+
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=hs_flags
+        )
+        return database
+    except hyperscan.error as e:
+        logger.debug(f"Hyperscan compile failed, using re: {e}")
+        return None
+
+
+class MultiPatternMatcher:
+    """
+    Match a set of patterns against a buffer in a single pass
+
+    With Hyperscan installed, all patterns are compiled into one database and
+    scanned together; otherwise each compiled pattern runs over the buffer.
+    Matches are reported as ``(pattern_index, start, end)`` sorted by offset.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[Pattern, int]]):
+        self.patterns = [compile_pattern(regex, flags) for regex, flags in patterns]
+        self._database = self._build_database(patterns) if hyperscan is not None else None
+
+    def scan(self, data: Buffer) -> List[Tuple[int, int, int]]:
+        """Return every match in data"""
+        if self._database is None:
+            return sorted(
+                ((index, match.start(), match.end())
+                 for index, pattern in enumerate(self.patterns)
+                 for match in pattern.finditer(data)),
+                key=lambda hit: (hit[1], hit[0])
+            )
+
+        # Hyperscan block mode needs bytes, so large buffers are scanned in
+        # overlapping slices; duplicates from the overlap collapse below
+        raw_hits: List[Tuple[int, int, int]] = []
+
+        for base, chunk in iter_buffer_chunks(data):
+            def on_match(index, start, end, flags, context, base=base):
+                raw_hits.append((index, base + start, base + end))
+
+            self._database.scan(chunk, match_event_handler=on_match)
+
+        return self._leftmost_longest(raw_hits)
+
+    @staticmethod
+    def _build_database(patterns: Sequence[Tuple[Pattern, int]]):
+        """Compile patterns into a Hyperscan block-mode database reporting match starts"""
+        return _hyperscan_database(patterns, hyperscan.HS_FLAG_SOM_LEFTMOST)
+
+    @staticmethod
+    def _leftmost_longest(raw_hits: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+        """Collapse Hyperscan's per-end-offset reports into non-overlapping matches"""
+        longest = {}
+        for index, start, end in raw_hits:
+            key = (index, start)
+            if longest.get(key, -1) < end:
+                longest[key] = end
+
+        hits = []
+        covered_until = {}
+        for (index, start), end in sorted(longest.items(), key=lambda item: (item[0][1], item[0][0])):
+            if start < covered_until.get(index, -1):
+                continue
+            covered_until[index] = end
+            hits.append((index, start, end))
+
+        return hits
+
+
+# Escapes whose meaning changes when lowercased (\D, \S, \x41, \1, ...); \d \s \w \b do not
+_CASE_SENSITIVE_ESCAPE_RE = re.compile(r'\\(?![dswb])[A-Za-z0-9]')
+
+
+def _foldable(pattern: Pattern) -> bool:
+    """True if a case-insensitive ASCII pattern means the same lowercased, against lowercased input"""
+    source = pattern.decode("latin-1") if isinstance(pattern, bytes) else pattern
+    return source.isascii() and "(?" not in source and not _CASE_SENSITIVE_ESCAPE_RE.search(source)
+
+
+class PatternSet:
+    """
+    Report which of a set of patterns occur anywhere in a buffer
+
+    With Hyperscan installed, all patterns are compiled into one database
+    and the buffer is scanned once, each pattern reporting only its first
+    match; otherwise each compiled pattern is searched for in turn. There,
+    case-insensitive patterns whose lowercased form means the same are
+    matched case-sensitively against a lowercased copy of the buffer, made
+    once per slice, which keeps ``re`` on its literal fast paths.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[Pattern, int]]):
+        self.patterns = [compile_pattern(regex, flags) for regex, flags in patterns]
+        self._database = (
+            _hyperscan_database(patterns, hyperscan.HS_FLAG_SINGLEMATCH) if hyperscan is not None else None
+        )
+        self._folded = {} if self._database is not None else {
+            index: compile_pattern(regex.lower(), flags & ~re.IGNORECASE)
+            for index, (regex, flags) in enumerate(patterns)
+            if flags & re.IGNORECASE and _foldable(regex)
+        }
+
+    @property
+    def single_pass(self) -> bool:
+        """True when every pattern is matched together in one Hyperscan pass"""
+        return self._database is not None
+
+    def matching(self, data: Buffer, candidates: Optional[Iterable[int]] = None) -> Set[int]:
+        """Indices of the patterns (limited to candidates, if given) that match in data"""
+        if self._database is None:
+            indices = range(len(self.patterns)) if candidates is None else candidates
+            folded = [index for index in indices if index in self._folded]
+            found = {
+                index for index in indices
+                if index not in self._folded and self.patterns[index].search(data)
+            }
+
+            for _base, chunk in iter_buffer_chunks(data) if folded else ():
+                lowered = chunk.lower()
+                found.update(index for index in folded if self._folded[index].search(lowered))
+                folded = [index for index in folded if index not in found]
+                if not folded:
+                    break
+
+            return found
+
+        found: Set[int] = set()
+
+        def on_match(index, start, end, flags, context):
+            found.add(index)
+
+        for _base, chunk in iter_buffer_chunks(data):
+            self._database.scan(chunk, match_event_handler=on_match)
+
+        return found if candidates is None else found.intersection(candidates)
+
+
+class LiteralPrescreen:
+    """
+    Report which groups of literal trigger strings occur in a buffer
+
+    Used to skip regex work on files that cannot match: each group lists
+    substrings at least one of which every match of the guarded pattern must
+    contain. With pyahocorasick installed all triggers are located in one
+    automaton pass; otherwise each is tested with a memmem-backed ``find``.
+    Case-insensitive prescreens match against lowercased copies of the
+    buffer, streamed in slices so large files are never copied whole.
+    """
+
+    def __init__(self, triggers: Mapping[Hashable, Sequence[bytes]], ignore_case: bool = False):
+        self._ignore_case = ignore_case
+        self._triggers = {
+            key: tuple(word.lower() if ignore_case else word for word in words)
+            for key, words in triggers.items()
+        }
+        self._automaton = self._build_automaton(self._triggers) if ahocorasick is not None else None
+        # A trigger split across slices must still be whole in one of them
+        self._overlap = max((len(word) for words in self._triggers.values() for word in words), default=1) - 1
+
+    def hits(self, data: Buffer) -> Set[Hashable]:
+        """Return the keys of every group with a trigger present in data"""
+        if not self._ignore_case and self._automaton is None:
+            return self._find_hits(data)
+
+        found = set()
+        for _base, chunk in iter_buffer_chunks(data, overlap=self._overlap):
+            if self._ignore_case:
+                chunk = chunk.lower()
+            found.update(self._find_hits(chunk) if self._automaton is None else self._automaton_hits(chunk))
+            if len(found) == len(self._triggers):
+                break
+        return found
+
+    def _find_hits(self, data: Buffer) -> Set[Hashable]:
+        # find() rather than ``in``: mmap only supports single-byte membership
+        return {key for key, words in self._triggers.items() if any(data.find(word, 0) != -1 for word in words)}
+
+    def _automaton_hits(self, data: bytes) -> Set[Hashable]:
+        found = set()
+        haystack = data.decode("latin-1") if ahocorasick.unicode else data
+        for _end, keys in self._automaton.iter(haystack):
+            found.update(keys)
+            if len(found) == len(self._triggers):
+                break
+        return found
+
+    @staticmethod
+    def _build_automaton(triggers: Mapping[Hashable, Sequence[bytes]]):
+        """Compile every trigger into one automaton mapping word to group keys"""
+        groups: Dict[bytes, List[Hashable]] = {}
+        for key, words in triggers.items():
+            for word in words:
+                groups.setdefault(word, []).append(key)
+
+        automaton = ahocorasick.Automaton()
+        for word, keys in groups.items():
+            automaton.add_word(word.decode("latin-1") if ahocorasick.unicode else word, tuple(keys))
+        automaton.make_automaton()
+        return automaton
@@ -13,10 +13,24 @@ All adapters use the same core state format but add CLI-specific metadata.
 import json
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Notes included in every export's instructions (shared, read-only)
+_IMPORTANT_NOTES = (
+    "All workflows are dynamically generated - no hardcoded paths",
+    "Use Graphiti for decision history and architecture evolution",
+    "Serena memory contains code context and project structure"
+)
+
 
 class CLIAdapter(ABC):
     """Base class for CLI-specific adapters"""
@@ -35,6 +49,26 @@ class CLIAdapter(ABC):
         """Generate CLI-specific resume command"""
         pass
 
+    def _write(self, export_data: Dict[str, Any], output_path: Path) -> Path:
+        """
+        Write export data as indented JSON, replacing output_path atomically
+
+        The document is serialized (with orjson when installed) before a
+        temporary sibling is written and renamed over output_path, so readers
+        never see a partial export.
+        """
+        if orjson is not None:
+            payload = orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(export_data, indent=2).encode()
+
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(output_path)
+
+        self.logger.info(f"{self.cli_name.capitalize()} export created: {output_path}")
+        return output_path
+
     def _get_base_export(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Get base export structure (CLI-agnostic)"""
         return {
@@ -54,17 +88,44 @@ class CLIAdapter(ABC):
             "next_action": state.get("next_recommended_action", "Resume from checkpoint"),
             "completed": state.get("completed_phases", []),
             "pending": state.get("pending_phases", []),
-            "important_notes": [
-                "All workflows are dynamically generated - no hardcoded paths",
-                "Use Graphiti for decision history and architecture evolution",
-                "Serena memory contains code context and project structure"
-            ]
+            "important_notes": _IMPORTANT_NOTES
         }
 
 
 class GeminiAdapter(CLIAdapter):
     """Adapter for Gemini CLI"""
 
+    # Gemini model and tool configuration (shared, read-only)
+    _GEMINI_CONFIG = {
+        "model": "gemini-1.5-pro",
+        "tools": ["mcp_rube", "mcp_serena", "mcp_graphiti", "mcp_sequential"],
+        "temperature": 0.7,
+        "top_p": 0.95,
+        "top_k": 40,
+        "safety_settings": {
+            "harassment": "BLOCK_NONE",
+            "hate": "BLOCK_NONE",
+            "sexual": "BLOCK_NONE",
+            "dangerous": "BLOCK_NONE"
+        }
+    }
+
+    # Gemini setup and resume steps (shared, read-only)
+    _GEMINI_INSTRUCTIONS = {
+        "setup": [
+            "Ensure Gemini CLI is installed and authenticated",
+            "Verify MCP servers are accessible",
+            "Load project context from state"
+        ],
+        "resume_steps": [
+            "1. Load checkpoint state",
+            "2. Retrieve Graphiti episodes for context",
+            "3. Load Serena project memory",
+            "4. Resume from current phase",
+            "5. Follow workflow_config for next steps"
+        ]
+    }
+
     def __init__(self):
         super().__init__("gemini")
 
@@ -73,41 +134,12 @@ class GeminiAdapter(CLIAdapter):
         export_data = self._get_base_export(state)
 
         # Add Gemini-specific configuration
-        export_data["gemini_config"] = {
-            "model": "gemini-1.5-pro",
-            "tools": ["mcp_rube", "mcp_serena", "mcp_graphiti", "mcp_sequential"],
-            "temperature": 0.7,
-            "top_p": 0.95,
-            "top_k": 40,
-            "safety_settings": {
-                "harassment": "BLOCK_NONE",
-                "hate": "BLOCK_NONE",
-                "sexual": "BLOCK_NONE",
-                "dangerous": "BLOCK_NONE"
-            }
-        }
+        export_data["gemini_config"] = self._GEMINI_CONFIG
 
         # Add Gemini-specific resume instructions
-        export_data["gemini_instructions"] = {
-            "setup": [
-                "Ensure Gemini CLI is installed and authenticated",
-                "Verify MCP servers are accessible",
-                "Load project context from state"
-            ],
-            "resume_steps": [
-                "1. Load checkpoint state",
-                "2. Retrieve Graphiti episodes for context",
-                "3. Load Serena project memory",
-                "4. Resume from current phase",
-                "5. Follow workflow_config for next steps"
-            ]
-        }
-
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        export_data["gemini_instructions"] = self._GEMINI_INSTRUCTIONS
 
-        self.logger.info(f"Gemini export created: {output_path}")
-        return output_path
+        return self._write(export_data, output_path)
 
     def generate_resume_command(self, checkpoint_path: Path) -> str:
         """Generate Gemini CLI resume command"""
@@ -121,6 +153,22 @@ class GeminiAdapter(CLIAdapter):
 class CopilotAdapter(CLIAdapter):
     """Adapter for GitHub Copilot CLI"""
 
+    # Copilot agent configuration (shared, read-only)
+    _COPILOT_CONFIG = {
+        "agent_mode": "sdlc_orchestrator",
+        "workspace_context": True,
+        "github_integration": True,
+        "pr_automation": True,
+        "issue_tracking": True
+    }
+
+    # Copilot workflow automation settings (shared, read-only)
+    _COPILOT_WORKFLOW_INTEGRATION = {
+        "use_github_actions": True,
+        "auto_pr_creation": True,
+        "code_review_automation": True
+    }
+
     def __init__(self):
         super().__init__("copilot")
 
@@ -129,13 +177,7 @@ class CopilotAdapter(CLIAdapter):
         export_data = self._get_base_export(state)
 
         # Add Copilot-specific configuration
-        export_data["copilot_config"] = {
-            "agent_mode": "sdlc_orchestrator",
-            "workspace_context": True,
-            "github_integration": True,
-            "pr_automation": True,
-            "issue_tracking": True
-        }
+        export_data["copilot_config"] = self._COPILOT_CONFIG
 
         # Add Copilot-specific instructions
         export_data["copilot_instructions"] = {
@@ -143,18 +185,10 @@ class CopilotAdapter(CLIAdapter):
                 "repo_urls": self._extract_repo_urls(state),
                 "branch_strategy": state.get("workflow_config", {}).get("repo_structure", "single_repo")
             },
-            "workflow_integration": {
-                "use_github_actions": True,
-                "auto_pr_creation": True,
-                "code_review_automation": True
-            }
+            "workflow_integration": self._COPILOT_WORKFLOW_INTEGRATION
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
-
-        self.logger.info(f"Copilot export created: {output_path}")
-        return output_path
+        return self._write(export_data, output_path)
 
     def generate_resume_command(self, checkpoint_path: Path) -> str:
         """Generate Copilot CLI resume command"""
@@ -172,6 +206,29 @@ class CopilotAdapter(CLIAdapter):
 class QwenAdapter(CLIAdapter):
     """Adapter for Qwen CLI"""
 
+    # Qwen model configuration (shared, read-only)
+    _QWEN_CONFIG = {
+        "model": "qwen-turbo",
+        "enable_tools": True,
+        "enable_plugins": True,
+        "max_tokens": 8000,
+        "temperature": 0.7
+    }
+
+    # Qwen plugin and tool requirements (shared, read-only)
+    _QWEN_INSTRUCTIONS = {
+        "plugin_requirements": [
+            "Document analysis plugin",
+            "Code generation plugin",
+            "API integration plugin"
+        ],
+        "tool_configuration": {
+            "enable_web_search": False,
+            "enable_code_interpreter": True,
+            "enable_file_operations": True
+        }
+    }
+
     def __init__(self):
         super().__init__("qwen")
 
@@ -180,33 +237,12 @@ class QwenAdapter(CLIAdapter):
         export_data = self._get_base_export(state)
 
         # Add Qwen-specific configuration
-        export_data["qwen_config"] = {
-            "model": "qwen-turbo",
-            "enable_tools": True,
-            "enable_plugins": True,
-            "max_tokens": 8000,
-            "temperature": 0.7
-        }
+        export_data["qwen_config"] = self._QWEN_CONFIG
 
         # Add Qwen-specific instructions
-        export_data["qwen_instructions"] = {
-            "plugin_requirements": [
-                "Document analysis plugin",
-                "Code generation plugin",
-                "API integration plugin"
-            ],
-            "tool_configuration": {
-                "enable_web_search": False,
-                "enable_code_interpreter": True,
-                "enable_file_operations": True
-            }
-        }
+        export_data["qwen_instructions"] = self._QWEN_INSTRUCTIONS
 
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
-
-        self.logger.info(f"Qwen export created: {output_path}")
-        return output_path
+        return self._write(export_data, output_path)
 
     def generate_resume_command(self, checkpoint_path: Path) -> str:
         """Generate Qwen CLI resume command"""
@@ -220,6 +256,32 @@ class QwenAdapter(CLIAdapter):
 class UniversalAdapter(CLIAdapter):
     """Universal adapter for any LLM CLI"""
 
+    # Resume guidance for any LLM CLI (shared, read-only)
+    _UNIVERSAL_INSTRUCTIONS = {
+        "how_to_resume": [
+            "1. Load this checkpoint file",
+            "2. Read the 'state' object for current progress",
+            "3. Read 'instructions' for human-readable context",
+            "4. Query Graphiti using episode_ids for detailed history",
+            "5. Load Serena memory using memory_keys for code context",
+            "6. Follow 'next_recommended_action' to continue",
+            "7. Respect 'workflow_config' for project-specific settings"
+        ],
+        "key_principles": [
+            "NO HARDCODING - All workflows are dynamic",
+            "Use Graphiti for temporal context and decisions",
+            "Use Serena for code semantics and project memory",
+            "Respect human gates - always ask for approval",
+            "Save checkpoints frequently (every 30 min or phase completion)"
+        ],
+        "required_capabilities": [
+            "File read/write operations",
+            "MCP server integration (Rube, Serena, Graphiti, Sequential)",
+            "Code generation and editing",
+            "Human interaction (AskUserQuestion equivalent)"
+        ]
+    }
+
     def __init__(self):
         super().__init__("universal")
 
@@ -228,36 +290,9 @@ class UniversalAdapter(CLIAdapter):
         export_data = self._get_base_export(state)
 
         # Add comprehensive instructions for any LLM
-        export_data["universal_instructions"] = {
-            "how_to_resume": [
-                "1. Load this checkpoint file",
-                "2. Read the 'state' object for current progress",
-                "3. Read 'instructions' for human-readable context",
-                "4. Query Graphiti using episode_ids for detailed history",
-                "5. Load Serena memory using memory_keys for code context",
-                "6. Follow 'next_recommended_action' to continue",
-                "7. Respect 'workflow_config' for project-specific settings"
-            ],
-            "key_principles": [
-                "NO HARDCODING - All workflows are dynamic",
-                "Use Graphiti for temporal context and decisions",
-                "Use Serena for code semantics and project memory",
-                "Respect human gates - always ask for approval",
-                "Save checkpoints frequently (every 30 min or phase completion)"
-            ],
-            "required_capabilities": [
-                "File read/write operations",
-                "MCP server integration (Rube, Serena, Graphiti, Sequential)",
-                "Code generation and editing",
-                "Human interaction (AskUserQuestion equivalent)"
-            ]
-        }
+        export_data["universal_instructions"] = self._UNIVERSAL_INSTRUCTIONS
 
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
-
-        self.logger.info(f"Universal export created: {output_path}")
-        return output_path
+        return self._write(export_data, output_path)
 
     def generate_resume_command(self, checkpoint_path: Path) -> str:
         """Generate universal resume command"""
@@ -318,13 +353,15 @@ class AdapterFactory:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        exports = {}
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        for cli_type in cls._adapters.keys():
-            adapter = cls.create(cli_type)
-            output_path = output_dir / f"export_{cli_type}_{timestamp}.json"
-            export_path = adapter.export(state, output_path)
-            exports[cli_type] = export_path
+        # Exports are independent and mostly file I/O, so they are written concurrently
+        with ThreadPoolExecutor(max_workers=len(cls._adapters)) as executor:
+            futures = {
+                cli_type: executor.submit(
+                    cls.create(cli_type).export, state, output_dir / f"export_{cli_type}_{timestamp}.json"
+                )
+                for cli_type in cls._adapters
+            }
 
-        return exports
+            return {cli_type: future.result() for cli_type, future in futures.items()}
@@ -7,13 +7,22 @@ Validates:
 - ComplianceValidator imports and control validation
 """
 
+from dataclasses import asdict
 from pathlib import Path
+import asyncio
+import os
 import sys
+import tempfile
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from agents.security import AuditorEnhanced, SecretScanner, ComplianceValidator, SOC2Control, SecurityIssue
+from agents.security import secret_scanner
+
+# Fixture secrets, assembled at runtime so this file holds no literal credentials
+AWS_KEY = "AKIA" + "IEQH524YNG5BY1A2"
+STRIPE_KEY = "sk_live_" + "a1B2c3D4" * 3
 
 
 def test_imports():
@@ -135,6 +144,375 @@ def test_dataclasses():
         return False
 
 
+def test_async_audit_matches_sync():
+    """Test comprehensive_audit_async reports the same findings as the sync audit"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            (project_root / "app.py").write_text(
+                'password = "hunter2hunter2"\n'
+                'import hashlib\n'
+                'digest = hashlib.md5(data)\n'
+            )
+            (project_root / "requirements.txt").write_text("django==3.1\n")
+
+            auditor = AuditorEnhanced(project_root)
+            sync_report = auditor.comprehensive_audit()
+            async_report = asyncio.run(auditor.comprehensive_audit_async())
+
+            for report in (sync_report, async_report):
+                report.pop("timestamp", None)
+
+            assert sync_report["summary"]["total_issues"] > 0, "Expected findings in fixture project"
+            assert async_report == sync_report, "Async audit diverged from sync audit"
+
+        print("✓ Async audit: Matches synchronous audit")
+        print(f"  - Issues: {async_report['summary']['total_issues']}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Async audit test failed: {e}")
+        return False
+
+
+def test_owasp_line_numbers():
+    """Test OWASP findings report the line of the first match"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            (project_root / "app.py").write_text(
+                "import hashlib\n"
+                "\n"
+                "digest = hashlib.md5(data)\n"
+                "obj = pickle.loads(blob)\n"
+            )
+
+            issues = AuditorEnhanced(project_root).scan_owasp_top10()
+            lines = {issue.title: issue.line_number for issue in issues}
+
+            assert lines.get("A02: Weak cryptographic hash") == 3, f"Unexpected lines: {lines}"
+            assert lines.get("A08: Insecure deserialization") == 4, f"Unexpected lines: {lines}"
+
+        print("✓ OWASP line numbers: Reported from match offsets")
+
+        return True
+    except Exception as e:
+        print(f"✗ OWASP line number test failed: {e}")
+        return False
+
+
+def test_owasp_checks_accept_text():
+    """Test the per-category OWASP checks still accept file text as well as bytes"""
+    try:
+        auditor = AuditorEnhanced(Path(__file__).parent.parent)
+        file_path = Path("app.py")
+        content = 'x = 1\ncursor.execute("SELECT * FROM t WHERE id=" + user_id)\n'
+
+        issues = auditor._check_injection(content, file_path)
+        titles = [(issue.title, issue.line_number) for issue in issues]
+
+        assert titles == [("A03: SQL Injection risk", 2)], f"Unexpected issues: {titles}"
+        assert titles == [
+            (issue.title, issue.line_number) for issue in auditor._check_injection(content.encode(), file_path)
+        ], "Text and bytes results differ"
+
+        print("✓ OWASP checks: Text input accepted")
+
+        return True
+    except Exception as e:
+        print(f"✗ OWASP text input test failed: {e}")
+        return False
+
+
+def test_dependency_name_matching():
+    """Test known-vulnerable packages match whole requirement names only"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            req_file = project_root / "requirements.txt"
+            req_file.write_text("requests-oauthlib==1.3.1\nDjango[argon2]>=3.1\n# flask is not used\n")
+
+            auditor = AuditorEnhanced(project_root)
+            packages = [vuln.package_name for vuln in auditor._check_python_dependencies(req_file)]
+
+            assert packages == ["django"], f"Unexpected matches: {packages}"
+
+        print("✓ Dependency matching: Whole package names only")
+
+        return True
+    except Exception as e:
+        print(f"✗ Dependency matching test failed: {e}")
+        return False
+
+
+def test_dependency_version_pins():
+    """Test exact pins outside the vulnerable range are not reported"""
+    try:
+        from agents.security import auditor_enhanced
+        if auditor_enhanced.Requirement is None:
+            print("✓ Dependency pins: Skipped (packaging not installed)")
+            return True
+
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            req_file = project_root / "requirements.txt"
+            req_file.write_text("Django==4.2  # patched\nflask==1.1.0\nrequests>=2.0\n")
+
+            auditor = AuditorEnhanced(project_root)
+            found = {vuln.package_name: vuln.current_version for vuln in auditor._check_python_dependencies(req_file)}
+
+            assert found == {"flask": "==1.1.0", "requests": ">=2.0"}, f"Unexpected matches: {found}"
+
+        print("✓ Dependency pins: Patched versions cleared, ranges still flagged")
+
+        return True
+    except Exception as e:
+        print(f"✗ Dependency pin test failed: {e}")
+        return False
+
+
+def test_npm_malformed_dependencies():
+    """Test package.json dependency maps that are not objects are treated as empty"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            (project_root / "web").mkdir()
+            (project_root / "web" / "package.json").write_text(
+                '{"dependencies": null, "devDependencies": {"express": "4.17.0"}}'
+            )
+            (project_root / "api").mkdir()
+            (project_root / "api" / "package.json").write_text('{"dependencies": ["axios"]}')
+
+            report = AuditorEnhanced(project_root).comprehensive_audit()
+            titles = [issue.title for issue in report["issues"] if issue.category == "dependency"]
+
+            assert titles == ["Vulnerable npm package: express"], f"Unexpected dependency issues: {titles}"
+
+        print("✓ npm dependencies: Malformed dependency maps ignored")
+
+        return True
+    except Exception as e:
+        print(f"✗ npm dependency test failed: {e}")
+        return False
+
+
+def test_dependency_cache_saved_on_early_stop():
+    """Test the dependency cache is saved when a scan is not iterated to the end"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            (project_root / "requirements.txt").write_text("flask==1.1.0\n")
+
+            auditor = AuditorEnhanced(project_root)
+            issues = auditor.scan_dependencies()
+            first = next(issues)
+            issues.close()
+
+            assert first.title == "Vulnerable dependency: flask", f"Unexpected issue: {first.title}"
+            assert auditor._dep_cache_path.exists(), "Dependency cache not saved after early stop"
+
+        print("✓ Dependency cache: Saved when the scan stops early")
+
+        return True
+    except Exception as e:
+        print(f"✗ Dependency cache test failed: {e}")
+        return False
+
+
+def _secret_findings(scanner):
+    """(file, line, pattern) of each finding from a full scan"""
+    return [(m.file_path, m.line_number, m.matched_pattern) for m in scanner.scan_for_secrets()]
+
+
+def test_secret_scan_cache():
+    """Test cached rescans match fresh scans and follow edits to scanned files"""
+    find_secrets = secret_scanner._find_secrets
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            app = project_root / "app.py"
+            app.write_text(f'aws = "{AWS_KEY}"\nstripe = "{STRIPE_KEY}"\n')
+
+            scanner = SecretScanner(project_root)
+            first = [asdict(m) for m in scanner.scan_for_secrets()]
+            assert len(first) == 2, f"Unexpected findings: {first}"
+            assert scanner._scan_cache_path.exists(), "Scan cache not written"
+
+            for rescanner in (scanner, SecretScanner(project_root)):
+                assert [asdict(m) for m in rescanner.scan_for_secrets()] == first, "Cached rescan diverged"
+
+            # A touch without an edit must reuse the cached hits, not rescan
+            st = app.stat()
+            os.utime(app, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            def fail_scan(data):
+                raise AssertionError("Unchanged file was rescanned")
+
+            secret_scanner._find_secrets = fail_scan
+            assert [asdict(m) for m in SecretScanner(project_root).scan_for_secrets()] == first, "Touched rescan diverged"
+            secret_scanner._find_secrets = find_secrets
+
+            # An edit shifting the secrets down is picked up with new line numbers
+            app.write_text(f'import os\n\naws = "{AWS_KEY}"\nstripe = "{STRIPE_KEY}"\n')
+            lines = [line for _, line, _ in _secret_findings(SecretScanner(project_root))]
+            assert lines == [3, 4], f"Unexpected lines after edit: {lines}"
+
+        print("✓ Secret scan cache: Reused when unchanged, refreshed on edit")
+
+        return True
+    except Exception as e:
+        print(f"✗ Secret scan cache test failed: {e}")
+        return False
+    finally:
+        secret_scanner._find_secrets = find_secrets
+
+
+def test_secret_custom_patterns():
+    """Test edits to a scanner's secret_patterns apply to that scanner only"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            (project_root / "app.py").write_text(f'aws = "{AWS_KEY}"\nbanner = "acme_tok_0123456789abcdef"\n')
+
+            scanner = SecretScanner(project_root)
+            scanner.secret_patterns.append({
+                "name": "Acme Token",
+                "regex": r"acme_tok_[0-9a-f]{16}",
+                "type": "token",
+                "provider": "acme",
+                "severity": "high",
+                "confidence": "medium"
+            })
+            scanner.secret_patterns[0]["name"] = "Renamed AWS Key"
+
+            custom = [(line, name) for _, line, name in _secret_findings(scanner)]
+            default = [(line, name) for _, line, name in _secret_findings(SecretScanner(project_root))]
+
+            assert custom == [(1, "Renamed AWS Key"), (2, "Acme Token")], f"Unexpected custom findings: {custom}"
+            assert default == [(1, "AWS Access Key ID")], f"Custom patterns leaked: {default}"
+
+            # Restoring the table returns the scanner to the built-in patterns
+            scanner.secret_patterns = scanner._initialize_secret_patterns()
+            assert [(line, name) for _, line, name in _secret_findings(scanner)] == default, "Default table not restored"
+
+        print("✓ Secret custom patterns: Applied per scanner")
+
+        return True
+    except Exception as e:
+        print(f"✗ Secret custom pattern test failed: {e}")
+        return False
+
+
+def test_secret_scan_excluded_dirs():
+    """Test only excluded directory names are pruned from secret scans"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            for relative in ("environment/settings.py", "builder.py", "node_modules/pkg/index.js", "env/lib/site.py"):
+                source = project_root / relative
+                source.parent.mkdir(parents=True, exist_ok=True)
+                source.write_text(f'key = "{AWS_KEY}"\n')
+
+            files = sorted(file for file, _, _ in _secret_findings(SecretScanner(project_root)))
+
+            assert files == ["builder.py", str(Path("environment/settings.py"))], f"Unexpected files: {files}"
+
+        print("✓ Secret scan exclusions: Directory names pruned, similar names scanned")
+
+        return True
+    except Exception as e:
+        print(f"✗ Secret scan exclusion test failed: {e}")
+        return False
+
+
+def test_secret_scan_dotenv():
+    """Test dotenv files are scanned by name and exempt from the size limit"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            (project_root / ".env").write_text(f"AWS_ACCESS_KEY_ID={AWS_KEY}\n")
+            # Larger than the scan size limit, which dotenv files are exempt from
+            (project_root / ".env.local").write_text("PADDING=1\n" * 250_000 + f"STRIPE={STRIPE_KEY}\n")
+
+            findings = sorted(_secret_findings(SecretScanner(project_root)))
+
+            assert findings == [
+                (".env", 1, "AWS Access Key ID"),
+                (".env.local", 250_001, "Stripe API Key")
+            ], f"Unexpected findings: {findings}"
+
+        print("✓ Secret scan dotenv: .env files scanned whatever their size")
+
+        return True
+    except Exception as e:
+        print(f"✗ Secret scan dotenv test failed: {e}")
+        return False
+
+
+def test_secret_scan_process_pool():
+    """Test scanning across the process pool matches the serial scan"""
+    min_files = secret_scanner._PARALLEL_SCAN_MIN_FILES
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            for index in range(40):
+                (project_root / f"module_{index}.py").write_text(
+                    "x = 1\n" * index + f'aws = "{AWS_KEY}"\n' + (f'stripe = "{STRIPE_KEY}"\n' if index % 3 else "")
+                )
+
+            serial = [asdict(m) for m in SecretScanner(project_root).scan_for_secrets()]
+
+            scanner = SecretScanner(project_root)
+            scanner._scan_cache_path.unlink()
+            secret_scanner._PARALLEL_SCAN_MIN_FILES = 1
+            parallel = [asdict(m) for m in scanner.scan_for_secrets()]
+
+            assert len(serial) == 66, f"Unexpected serial findings: {len(serial)}"
+            assert parallel == serial, "Process pool scan diverged from serial scan"
+
+        print("✓ Secret scan process pool: Matches serial scan")
+        print(f"  - Findings: {len(parallel)}")
+
+        return True
+    except Exception as e:
+        print(f"✗ Secret scan process pool test failed: {e}")
+        return False
+    finally:
+        secret_scanner._PARALLEL_SCAN_MIN_FILES = min_files
+
+
+def test_compliance_evidence():
+    """Test compliance checks report evidence from a single shared scan"""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            project_root = Path(tmp)
+            (project_root / "app.py").write_text(
+                "import logging\n"
+                "from cryptography.fernet import Fernet\n"
+                "ctx.minimum_version = ssl.TLSVersion.TLSv1_2\n"
+                "requests.get(url, verify=False)\n"
+            )
+
+            results = ComplianceValidator(project_root).validate_all_controls()
+            descriptions = {e.description for result in results.values() for e in result.evidence}
+
+            for expected in (
+                "Logging implementation detected",
+                "Encryption at rest detected",
+                "Strong TLS version detected: TLSv1_[23]",
+                "Certificate validation disabled"
+            ):
+                assert expected in descriptions, f"Missing evidence {expected!r}: {descriptions}"
+            assert "MFA not implemented" in descriptions, "Unexpected MFA evidence"
+
+        print("✓ Compliance evidence: Detected from source scan")
+
+        return True
+    except Exception as e:
+        print(f"✗ Compliance evidence test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -147,7 +525,20 @@ def main():
         ("AuditorEnhanced Test", test_auditor_enhanced),
         ("SecretScanner Test", test_secret_scanner),
         ("ComplianceValidator Test", test_compliance_validator),
-        ("Dataclasses Test", test_dataclasses)
+        ("Dataclasses Test", test_dataclasses),
+        ("Async Audit Test", test_async_audit_matches_sync),
+        ("OWASP Line Number Test", test_owasp_line_numbers),
+        ("OWASP Text Input Test", test_owasp_checks_accept_text),
+        ("Dependency Matching Test", test_dependency_name_matching),
+        ("Dependency Pin Test", test_dependency_version_pins),
+        ("npm Dependency Test", test_npm_malformed_dependencies),
+        ("Dependency Cache Test", test_dependency_cache_saved_on_early_stop),
+        ("Secret Scan Cache Test", test_secret_scan_cache),
+        ("Secret Custom Pattern Test", test_secret_custom_patterns),
+        ("Secret Scan Exclusion Test", test_secret_scan_excluded_dirs),
+        ("Secret Scan Dotenv Test", test_secret_scan_dotenv),
+        ("Secret Scan Process Pool Test", test_secret_scan_process_pool),
+        ("Compliance Evidence Test", test_compliance_evidence)
     ]
 
     results = []